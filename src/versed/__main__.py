@@ -1,8 +1,5 @@
 from versed.app import DocumentChat
 
 def cli():
-    try:
-        app = DocumentChat("versed")
-        app.run()
-    finally:
-        app.vector_store.close_client()
\ No newline at end of file
+    app = DocumentChat("versed")
+    app.run()
@@ -1,6 +1,6 @@
+import httpx
 import json
-from platformdirs import user_data_dir
-from pathlib import Path
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 from textual.app import App
 
 from versed.screens.chat_screen import ChatScreen
@@ -11,6 +11,8 @@ from versed.screens.key_load_screen import LoadKeyScreen
 from versed.screens.quit_screen import QuitScreen
 
 from versed.google_auth_handler import GoogleAuthHandler
+from versed.paths import ensure_data_dir
+from versed.process_pool import create_process_pool
 from versed.secret_handler import SecretHandler
 from versed.vector_store import VectorStore
 
@@ -23,22 +25,38 @@ class DocumentChat(App):
         ("d", "toggle_dark", "Toggle dark mode")
     ]
 
+    # One stylesheet for every screen and pane, parsed once at startup
+    CSS_PATH = "app.css"
+
+    SCREENS = {
+        "add_key": AddKeyScreen,
+        "load_key": LoadKeyScreen,
+        "add_collection": AddCollectionScreen,
+        "select_collection": SelectCollectionScreen,
+    }
+
     DEFAULT_COLLECTION_NAME = "DefaultCollection"
 
     def __init__(self, app_name: str) -> None:
         super().__init__()
         self.app_name = app_name
 
-        data_dir = Path(user_data_dir(self.app_name))
-        data_dir.mkdir(parents=True, exist_ok=True)
+        data_dir = ensure_data_dir(self.app_name)
 
         self.auth_handler = GoogleAuthHandler(self.app_name)
         self.credentials = self.auth_handler.fetch_credentials()
         self.api_key = None
+        # Shared by the chat for the whole session so its connection pool stays warm
+        self.openai_client = None
 
+        # One pool of worker processes is shared by file parsing and text splitting
+        self.process_pool = create_process_pool()
+
+        # The vector store owns its Milvus client for the lifetime of the app, and closes it on unmount
         self.vector_store = VectorStore(
             app=self,
             data_dir=data_dir,
+            process_pool=self.process_pool,
             default_collection_name=DocumentChat.DEFAULT_COLLECTION_NAME,
             google_credentials=self.credentials
         )
@@ -90,24 +108,45 @@ class DocumentChat(App):
                     secret_handler = SecretHandler(self.app_name)
                     api_key = secret_handler.load_api_key(key)
                     self.api_key = api_key
-                    self.vector_store.initialise_openai_client(api_key)
+                    self.openai_client = AsyncOpenAI(
+                        api_key=api_key,
+                        http_client=self._make_http_client()
+                    )
+                    self.vector_store.initialise_openai_client(self.openai_client)
                 except:
                     self.log(f"Unable to load key '{key}'.")
 
         self.push_screen("load_key", select_key)
 
+    @staticmethod
+    def _make_http_client() -> httpx.AsyncClient:
+        """
+        Builds the HTTP client behind the OpenAI client, keeping one warm connection per
+        concurrent embedding request so batches reuse them instead of reconnecting.
+        """
+        return DefaultAsyncHttpxClient(
+            limits=httpx.Limits(
+                max_connections=VectorStore.EMBED_CONCURRENCY * 2,
+                max_keepalive_connections=VectorStore.EMBED_CONCURRENCY
+            ),
+            timeout=httpx.Timeout(60.0, connect=10.0)
+        )
+
     async def on_mount(self) -> None:
-        # Install screens with the necessary constructor arguments
+        # The chat screen is shown immediately; the rest are built on first push via SCREENS
         self.install_screen(ChatScreen(), name="chat")
-        self.install_screen(AddKeyScreen(), name="add_key")
-        self.install_screen(LoadKeyScreen(), name="load_key")
-        self.install_screen(AddCollectionScreen(), name="add_collection")
-        self.install_screen(SelectCollectionScreen(), name="select_collection")
 
         self.title = "Versed"
 
         self.push_screen("chat")
 
+    async def on_unmount(self) -> None:
+        self.vector_store.close_client()
+        if self.process_pool is not None:
+            self.process_pool.shutdown(wait=False, cancel_futures=True)
+        if self.openai_client:
+            await self.openai_client.close()
+
     def on_vector_store_update(self):
         self.collection_names = self.vector_store.get_collection_names()
         collection_names = [option for option in self.collection_names]
@@ -129,8 +168,6 @@ class DocumentChat(App):
 
 
 if __name__ == "__main__":
-    try:
-        app = DocumentChat("versed")
-        app.run()
-    finally:
-        app.milvus_client.close()
+    app = DocumentChat("versed")
+    app.run()
+
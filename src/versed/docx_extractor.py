@@ -0,0 +1,116 @@
+import io
+from typing import List
+import zipfile
+
+from docx import Document
+from docx.text.paragraph import Paragraph
+from docx.table import Table
+from lxml import etree
+
+# WordprocessingML namespace, as used in the tags of word/document.xml
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+# Text equivalents of the run content elements python-docx includes in Run.text
+_RUN_TEXT = {
+    f"{_W}tab": "\t",
+    f"{_W}ptab": "\t",
+    f"{_W}cr": "\n",
+    f"{_W}noBreakHyphen": "-",
+}
+
+
+def extract_docx_text(source: bytes | str) -> str:
+    """
+    Extracts string content from a Word (.docx) file, given either its raw bytes or its
+    path on disk.
+
+    This module only imports what parsing needs, so worker processes that run this
+    function start quickly.
+    """
+    # Documents without tables are streamed straight from their XML, which avoids
+    # building python-docx objects for every paragraph purely to read their text
+    content = _extract_docx_paragraphs(source)
+    if content is None:
+        content = _extract_docx_document(source)
+    return content
+
+
+def _open_source(source: bytes | str):
+    # Paths are opened lazily by zipfile and python-docx, so the file is never read whole
+    return source if isinstance(source, str) else io.BytesIO(source)
+
+
+def _extract_docx_paragraphs(source: bytes | str) -> str | None:
+    """
+    Extracts the body paragraphs of a Word (.docx) file with a single lxml pass over
+    word/document.xml, producing the same text as `_extract_docx_document`.
+
+    Returns:
+        str | None: The content, or None if the document has tables or an unusual layout.
+    """
+    parts: List[str] = []
+    try:
+        with zipfile.ZipFile(_open_source(source)) as archive, archive.open("word/document.xml") as xml:
+            for _, element in etree.iterparse(xml, events=("end",), tag=(f"{_W}p", f"{_W}tbl")):
+                if element.getparent().tag != f"{_W}body":
+                    continue
+                if element.tag == f"{_W}tbl":
+                    return None
+                parts.append(_paragraph_text(element))
+                parts.append("\n\n")
+                element.clear()
+    except (KeyError, zipfile.BadZipFile, etree.XMLSyntaxError):
+        return None
+
+    return "".join(parts)
+
+
+def _paragraph_text(paragraph) -> str:
+    """
+    Gets the text of a w:p element, matching python-docx's Paragraph.text.
+    """
+    parts: List[str] = []
+    for child in paragraph:
+        if child.tag == f"{_W}r":
+            _append_run_text(child, parts)
+        elif child.tag == f"{_W}hyperlink":
+            for run in child.iterchildren(f"{_W}r"):
+                _append_run_text(run, parts)
+    return "".join(parts)
+
+
+def _append_run_text(run, parts: List[str]) -> None:
+    for element in run:
+        tag = element.tag
+        if tag == f"{_W}t":
+            parts.append(element.text or "")
+        elif tag == f"{_W}br":
+            # Only line breaks produce text; page and column breaks are dropped
+            if element.get(f"{_W}type", "textWrapping") == "textWrapping":
+                parts.append("\n")
+        elif tag in _RUN_TEXT:
+            parts.append(_RUN_TEXT[tag])
+
+
+def _extract_docx_document(source: bytes | str) -> str:
+    """
+    Extracts string content from a Word (.docx) file using python-docx, including tables.
+    """
+    doc = Document(_open_source(source))
+
+    parts: List[str] = []
+
+    # Iterate over all block-level elements
+    for element in doc.iter_inner_content():
+        if isinstance(element, Paragraph):
+            parts.append(f"{element.text}\n\n")
+        elif isinstance(element, Table):
+            parts.append("<Table>\n")
+            for row in element.rows:
+                parts.append("<Row>\n")
+                for cell in row.cells:
+                    parts.extend(["<Cell>\n", f"{cell.text}\n", "</Cell>\n"])
+                parts.append("</Row>\n")
+            parts.append("</Table>\n\n")
+
+    return "".join(parts)
@@ -0,0 +1,65 @@
+from array import array
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+
+class EmbeddingCache:
+    """
+    Content-addressed store of chunk embeddings, persisted in SQLite so re-added files and
+    repeated boilerplate are not embedded again.
+    """
+
+    def __init__(self, path: Path, model: str, dimensions: int) -> None:
+        # The model and width are part of every key, so changing either never reuses stale vectors
+        self._key_prefix = f"{model}:{dimensions}:".encode("utf-8")
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS emb_cache (hash BLOB PRIMARY KEY, vec BLOB NOT NULL)"
+        )
+        self._connection.commit()
+
+    def key(self, chunk: str) -> bytes:
+        """
+        Gets the cache key of a chunk.
+        """
+        return hashlib.sha256(self._key_prefix + chunk.encode("utf-8")).digest()
+
+    def get_many(self, keys: Iterable[bytes]) -> Dict[bytes, List[float]]:
+        """
+        Looks up the cached embeddings of many keys.
+
+        Returns:
+            Dict[bytes, List[float]]: The embeddings found, keyed by cache key.
+        """
+        keys = list(keys)
+        found = {}
+        with self._lock:
+            # Stay well under SQLite's limit on bound parameters per statement
+            for start in range(0, len(keys), 500):
+                batch = keys[start:start + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._connection.execute(
+                    f"SELECT hash, vec FROM emb_cache WHERE hash IN ({placeholders})", batch
+                )
+                for key, vec in rows:
+                    found[key] = array("f", vec).tolist()
+        return found
+
+    def put_many(self, items: Iterable[Tuple[bytes, List[float]]]) -> None:
+        """
+        Stores many embeddings, keyed by cache key.
+        """
+        rows = [(key, array("f", embedding).tobytes()) for key, embedding in items]
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO emb_cache (hash, vec) VALUES (?, ?)", rows
+            )
+            self._connection.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
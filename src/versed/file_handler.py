@@ -1,17 +1,20 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
 import csv
 import io
 import json
+import mmap
+import os
 from pathlib import Path
-from typing import Dict
+from typing import IO, AsyncIterator, Dict, List, Tuple
 
-from docx import Document
-from docx.text.paragraph import Paragraph
-from docx.table import Table
 import pandas as pd
 from pptx import Presentation
 from pypdf import PdfReader
+from versed.docx_extractor import extract_docx_text
 from versed.gdrive_file_handler import GoogleDriveHandler
 
+
 class LocalFileHandler:
 
     def __init__(self):
@@ -26,50 +29,140 @@ class LocalFileHandler:
 
         Returns:
             Dict: {
-                "stream": io.BytesIO: The file stream of the file,
-                "type": str: The file extension of the file
+                "stream": IO[bytes]: The file stream of the file,
+                "type": str: The file extension of the file,
+                "disk_path": str: The path of the file on disk
             }
         """
         extension = Path(file["name"]).suffix
         return {
             "stream": self._get_file_stream(file),
             "type": extension,
+            "disk_path": file["path"],
         }
 
-    def _get_file_stream(self, file: Dict) -> io.BytesIO:
+    def _get_file_stream(self, file: Dict) -> IO[bytes]:
         """
-        Gets the file stream of a file from disk.
+        Gets the file stream of a file from disk. The file is read as parsers consume it,
+        rather than loaded whole, and is closed once it has been parsed.
 
         Args:
             file (dict): {"path": file path on disk}
 
         Returns:
-            io.BytesIO: The file stream of the file.
+            IO[bytes]: The file stream of the file.
         """
         file_path = Path(file["path"])
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        with open(file_path, "rb") as f:
-            return io.BytesIO(f.read())
+        return open(file_path, "rb")
 
 
 class FileHandler:
 
-    def __init__(self, credentials):
+    def __init__(self, credentials, process_pool: ProcessPoolExecutor | None = None):
         self.local_file_handler = LocalFileHandler()
         self.gdrive_file_handler = GoogleDriveHandler(credentials)
+        # Worker processes for parsing Word documents, owned and shut down by the app
+        self.process_pool = process_pool
+
+    def get_gdrive_handler(self, credentials) -> GoogleDriveHandler:
+        """
+        Gets the shared Google Drive handler, replacing it if the credentials have changed
+        (e.g. after logging in), so its per-thread services are reused across callers.
+        """
+        if self.gdrive_file_handler.credentials is not credentials:
+            self.gdrive_file_handler = GoogleDriveHandler(credentials)
+        return self.gdrive_file_handler
+
+    async def iter_file_contents(self, files: List[Dict]) -> AsyncIterator[Tuple[Dict, str]]:
+        """
+        Extracts string content from many files concurrently, yielding each file's content
+        as soon as it is ready so callers can start on it while the rest are still loading.
+
+        Args:
+            files (List[Dict]): [{"name": file_name, "path": file path}, ...]
 
-    def get_file_stream(self, file) -> io.BytesIO:
+        Yields:
+            Tuple[Dict, str]: Each file with its content, in completion order.
+        """
+        tasks = [asyncio.create_task(self._load_with_file(file)) for file in files]
+        try:
+            for loaded in asyncio.as_completed(tasks):
+                yield await loaded
+        finally:
+            # Loads still running when the caller stops early (e.g. a file failed) are cancelled
+            # and awaited, so none is left running with its exception unretrieved
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _load_with_file(self, file: Dict) -> Tuple[Dict, str]:
+        return file, await self._load(file)
+
+    async def _load(self, file: Dict) -> str:
+        """
+        Fetches and parses a single file without blocking the event loop.
+        """
         if file["path"].startswith("gdrive://"):
-            resolved_file = self.gdrive_file_handler._get_google_drive_file_stream(file)
+            # The handler's pool is sized to bound the number of concurrent downloads
+            load = asyncio.ensure_future(self.gdrive_file_handler.run_in_pool(
+                self.gdrive_file_handler._get_google_drive_file_stream, file
+            ))
         else:
-            resolved_file = self.local_file_handler._get_local_file_stream(file)
+            load = asyncio.ensure_future(
+                asyncio.to_thread(self.local_file_handler._get_local_file_stream, file)
+            )
+
+        try:
+            resolved_file = await asyncio.shield(load)
+        except asyncio.CancelledError:
+            # A download on a worker thread can't be interrupted, so wait for it to end and
+            # release the stream (and any temporary file) it leaves behind
+            await asyncio.wait([load])
+            if not load.cancelled() and load.exception() is None:
+                self._release(load.result())
+            raise
+        return await self._parse(resolved_file)
+
+    async def _parse(self, resolved_file: Dict) -> str:
+        """
+        Extracts string content from a resolved file stream without blocking the event loop,
+        closing the stream (and removing any temporary download) once it has been parsed.
+        """
+        # Word parsing is CPU bound, so it runs in worker processes rather than under the GIL
+        if resolved_file["type"] in (".docx", ".gdoc") and self.process_pool is not None:
+            loop = asyncio.get_running_loop()
+            parse = loop.run_in_executor(
+                self.process_pool, extract_docx_text, self._docx_source(resolved_file)
+            )
+        else:
+            parse = asyncio.ensure_future(asyncio.to_thread(self._get_content, resolved_file))
+
+        try:
+            return await asyncio.shield(parse)
+        finally:
+            if not parse.done():
+                # Parsing can't be interrupted either, so the stream is only closed once the
+                # worker has finished reading it
+                await asyncio.wait([parse])
+                if not parse.cancelled():
+                    parse.exception()
+            self._release(resolved_file)
+
+    def _release(self, resolved_file: Dict) -> None:
+        """
+        Closes a resolved file's stream, removing the file if it is a temporary download.
+        """
+        resolved_file["stream"].close()
+        if resolved_file.get("temporary"):
+            os.remove(resolved_file["disk_path"])
 
-        return resolved_file
-    
-    def get_file_content(self, file) -> str:
-        resolved_file = self.get_file_stream(file)
+    def _get_content(self, resolved_file: Dict) -> str:
+        """
+        Extracts string content from a resolved file stream, based on its type.
+        """
         extension = resolved_file["type"]
 
         match extension:
@@ -94,34 +187,33 @@ class FileHandler:
     
     def _get_txt_content(self, file: Dict) -> str:
         """
-        Extracts string content from a .txt file.
+        Extracts string content from a .txt file. Files on disk are decoded straight from a
+        memory map, so the raw bytes are never copied into memory alongside the decoded string.
         """
-        return file["stream"].read().decode("utf-8")
+        stream = file["stream"]
+        try:
+            fileno = stream.fileno()
+        except (AttributeError, io.UnsupportedOperation):
+            return stream.read().decode("utf-8")
+
+        # Empty files cannot be memory mapped
+        if os.fstat(fileno).st_size == 0:
+            return ""
+        with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as mapped:
+            return str(mapped, "utf-8")
 
     def _get_docx_content(self, file: Dict) -> str:
         """
         Extracts string content from a Word (.docx) file.
         """
-        doc = Document(file["stream"])
-
-        file_content = ""
-
-        # Iterate over all block-level elements
-        for element in doc.iter_inner_content():
-            if isinstance(element, Paragraph):
-                file_content += f"{element.text}\n\n"
-            elif isinstance(element, Table):
-                file_content += "<Table>\n"
-                for row in element.rows:
-                    file_content += "<Row>\n"
-                    for cell in row.cells:
-                        file_content += "<Cell>\n"
-                        file_content += f"{cell.text}\n"
-                        file_content += "</Cell>\n"
-                    file_content += "</Row>\n"
-                file_content += "</Table>\n\n"
-
-        return file_content
+        return extract_docx_text(self._docx_source(file))
+
+    def _docx_source(self, file: Dict) -> bytes | str:
+        """
+        Gets what the Word extractor reads: the file's path when it is on disk, so large
+        documents are read in place rather than copied into memory, or else its bytes.
+        """
+        return file.get("disk_path") or file["stream"].read()
 
     def _get_pdf_content(self, file: Dict) -> str:
         """
@@ -1,13 +1,58 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 import io
+import os
 from pathlib import Path
-from typing import Dict
+import tempfile
+import threading
+from typing import IO, Dict, List, Tuple
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaIoBaseDownload
+import httplib2
 
 
 class GoogleDriveHandler:
+
+    DOWNLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+    # Downloads larger than this are spooled to a temporary file instead of held in memory
+    SPOOL_MAX_SIZE = 8 * 1024 * 1024
+    MAX_CONCURRENCY = 8
+    LIST_PAGE_SIZE = 1000
+
+    DOCX_MIME_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+    PPTX_MIME_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+
+    # Maps a file extension to (download mode, export MIME type, resolved file type)
+    _DISPATCH = {
+        ".txt": ("download", None, ".txt"),
+        ".pdf": ("download", None, ".pdf"),
+        ".ipynb": ("download", None, ".ipynb"),
+        ".docx": ("download", None, ".docx"),
+        ".xlsx": ("download", None, ".xlsx"),
+        ".pptx": ("download", None, ".pptx"),
+        ".csv": ("download", None, ".csv"),
+        ".gdoc": ("export", DOCX_MIME_TYPE, ".docx"),
+        ".gsheet": ("export", "text/csv", ".gsheet"),
+        ".gslides": ("export", PPTX_MIME_TYPE, ".gslides"),
+    }
+
     def __init__(self, credentials):
         self.credentials = credentials
+        # httplib2.Http is not thread-safe, so each worker thread gets its own service
+        self._local = threading.local()
+        self._executor = None
+
+    def _svc(self):
+        """
+        Gets the Google Drive API service for the current thread, building it on first use.
+        """
+        service = getattr(self._local, "service", None)
+        if service is None:
+            http = AuthorizedHttp(self.credentials, http=httplib2.Http())
+            service = build('drive', 'v3', http=http, cache_discovery=False)
+            self._local.service = service
+        return service
 
     def _get_google_drive_file_stream(self, file: Dict) -> Dict:
         """
@@ -18,111 +63,152 @@ class GoogleDriveHandler:
 
         Returns:
             Dict: {
-                "stream": io.BytesIO: The file stream of the file,
+                "stream": IO[bytes]: The file stream of the file,
                 "type": str: The file extension of the file
             }
         """
         extension = Path(file["name"]).suffix
         file_id = file["path"].split("/")[-1]
-        match extension:
-            case ".txt" | ".pdf" | ".ipynb" | ".docx" | ".xlsx" | ".pptx" | ".csv":
-                file["stream"] = self._get_raw_file_stream(file_id)
-                file["type"] = extension
-            case ".gdoc":
-                file["stream"] = self._get_google_doc_file_stream(file_id)
-                file["type"] = ".docx"
-            case ".gsheet":
-                file["stream"] = self._get_google_sheet_file_stream(file_id)
-                file["type"] = ".gsheet"
-            case ".gslides":
-                file["stream"] = self._get_google_slide_file_stream(file_id)
-                file["type"] = ".gslides"
-            case _:
-                raise ValueError(f"Unsupported file type: {extension}")
+        mode, mime_type, file_type = GoogleDriveHandler._DISPATCH.get(extension, (None, None, None))
+        if mode is None:
+            raise ValueError(f"Unsupported file type: {extension}")
+
+        file["stream"] = self._get_stream(file_id, mode, mime_type)
+        file["type"] = file_type
+        if isinstance(getattr(file["stream"], "name", None), str):
+            # Large downloads are spooled to a temporary file, removed once the file is parsed
+            file["disk_path"] = file["stream"].name
+            file["temporary"] = True
         
         return file
 
-    # Methods to get file streams:
-
-    def _get_raw_file_stream(self, file_id: str) -> io.BytesIO:
-        """
-        Gets the file stream of a .txt file from Google Drive.
+    async def run_in_pool(self, func, *args):
         """
-        service = build('drive', 'v3', credentials=self.credentials)
-        return self._download_file_stream(service, file_id)
+        Runs a blocking Google Drive call on the handler's worker threads.
 
-    def _get_google_doc_file_stream(self, file_id: str) -> io.BytesIO:
-        """
-        Gets the file stream of a Google Doc as a .docx file.
-        """
-        service = build('drive', 'v3', credentials=self.credentials)
-        return self._export_file_stream(
-            service, file_id, mime_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-        )
+        Args:
+            func: The blocking callable.
+            *args: Arguments for `func`.
 
-    def _get_google_sheet_file_stream(self, file_id: str) -> io.BytesIO:
-        """
-        Gets the file stream of a Google Sheet as a .csv file.
+        Returns:
+            The result of `func`.
         """
-        service = build('drive', 'v3', credentials=self.credentials)
-        return self._export_file_stream(service, file_id, mime_type="text/csv")
-    
-    def _get_google_slide_file_stream(self, file_id: str) -> io.BytesIO:
+        # A dedicated pool sized to MAX_CONCURRENCY keeps each thread's connection warm
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=GoogleDriveHandler.MAX_CONCURRENCY, thread_name_prefix="gdrive"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    def list_folder_page(self, folder_id: str = "root", page_token: str | None = None) -> Tuple[List[Dict], str | None]:
         """
-        Gets the file stream of a Google Slide as a .pptx file.
+        Lists one page of the files and folders directly inside a Google Drive folder,
+        with folders first and each group ordered by name.
 
         Args:
-            file_id (str): The ID of the Google Slides file.
+            folder_id (str): The ID of the folder.
+            page_token (str | None): The token of the page to list, or None for the first page.
 
         Returns:
-            io.BytesIO: The file stream of the exported .pptx file.
+            Tuple[List[Dict], str | None]: The page of files, and the token of the next page if there is one.
         """
-        service = build('drive', 'v3', credentials=self.credentials)
-        return self._export_file_stream(
-            service, file_id, mime_type="application/vnd.openxmlformats-officedocument.presentationml.presentation"
+        request = self._svc().files().list(
+            q=f"'{folder_id}' in parents and trashed = false",
+            fields="nextPageToken, files(id, name, mimeType)",
+            orderBy="folder,name",
+            pageSize=GoogleDriveHandler.LIST_PAGE_SIZE,
+            pageToken=page_token
         )
+        results = request.execute()
+        return results.get("files", []), results.get("nextPageToken")
 
     # Utility methods:
 
-    def _download_file_stream(self, service, file_id: str) -> io.BytesIO:
+    def _get_stream(self, file_id: str, mode: str, mime_type: str | None = None) -> IO[bytes]:
         """
-        Downloads a file stream from Google Drive.
+        Gets the file stream of a file from Google Drive, either downloading it as-is
+        or exporting it to another MIME type.
 
         Args:
-            service: Google Drive API service instance.
             file_id (str): The file ID.
+            mode (str): "download" to fetch the raw file, or "export" to convert it.
+            mime_type (str | None): The MIME type to export to, when exporting.
 
         Returns:
-            io.BytesIO: The file stream.
+            IO[bytes]: The file stream.
         """
-        request = service.files().get_media(fileId=file_id)
-        file_stream = io.BytesIO()
-        downloader = MediaIoBaseDownload(file_stream, request)
-
-        done = False
-        while not done:
-            status, done = downloader.next_chunk()
-        file_stream.seek(0)
-        return file_stream
-
-    def _export_file_stream(self, service, file_id: str, mime_type: str) -> io.BytesIO:
+        files = self._svc().files()
+        if mode == "export":
+            request = files.export_media(fileId=file_id, mimeType=mime_type)
+        else:
+            request = files.get_media(fileId=file_id)
+        return self._run_download(request)
+
+    def _run_download(self, request) -> IO[bytes]:
         """
-        Exports a Google Drive file to a specific MIME type and gets the file stream.
+        Runs a media download request to completion.
 
         Args:
-            service: Google Drive API service instance.
-            file_id (str): The file ID.
-            mime_type (str): The MIME type to export.
+            request: A Google Drive API media request.
 
         Returns:
-            io.BytesIO: The exported file stream.
+            IO[bytes]: The downloaded file stream, positioned at the start.
+        """
+        writer = _ChunkWriter(GoogleDriveHandler.SPOOL_MAX_SIZE)
+        downloader = MediaIoBaseDownload(
+            writer, request, chunksize=GoogleDriveHandler.DOWNLOAD_CHUNK_SIZE
+        )
+
+        try:
+            done = False
+            while not done:
+                status, done = downloader.next_chunk()
+        except BaseException:
+            writer.discard()
+            raise
+        return writer.to_stream()
+
+
+class _ChunkWriter:
+    """
+    Minimal file-like sink for MediaIoBaseDownload that keeps references to the
+    downloaded chunks rather than copying each one into a growing buffer. Once more
+    than `max_size` bytes have arrived, the download spills to a temporary file on disk.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.chunks = []
+        self.size = 0
+        self.file = None
+
+    def write(self, data) -> int:
+        if self.file is None:
+            self.chunks.append(data)
+            self.size += len(data)
+            if self.size > self.max_size:
+                # Named, so worker processes can read the download from disk themselves
+                self.file = tempfile.NamedTemporaryFile(delete=False)
+                self.file.writelines(self.chunks)
+                self.chunks = []
+        else:
+            self.file.write(data)
+        return len(data)
+
+    def discard(self) -> None:
+        """
+        Drops a partial download, removing its temporary file if it spilled to disk.
         """
-        request = service.files().export_media(fileId=file_id, mimeType=mime_type)
-        file_stream = io.BytesIO()
-        downloader = MediaIoBaseDownload(file_stream, request)
-
-        done = False
-        while not done:
-            status, done = downloader.next_chunk()
-        file_stream.seek(0)
-        return file_stream
+        self.chunks = []
+        if self.file is not None:
+            self.file.close()
+            os.remove(self.file.name)
+            self.file = None
+
+    def to_stream(self) -> IO[bytes]:
+        if self.file is not None:
+            self.file.seek(0)
+            return self.file
+        # Joining once yields a bytes object that BytesIO shares without copying
+        return io.BytesIO(b"".join(self.chunks))
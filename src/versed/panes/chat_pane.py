@@ -2,6 +2,9 @@ from textual import on
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal, Vertical, VerticalScroll
 from textual.events import Resize
+from textual.widget import AwaitMount
+from textual.strip import Strip
+from textual.visual import Visual
 from textual.widgets import (
     Button,
     Label,
@@ -9,105 +12,93 @@ from textual.widgets import (
     TextArea
 )
 
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 
-class ChatPane(Container):
-    """Pane with a chat window and text input stacked vertically."""
+class CachedMessage(Static):
+    """
+    Message widget that caches its rendered lines for its current size and style.
 
-    DEFAULT_CSS = """
-    #messages-window {
-        height: 80%;
-        background: $background;
-        border: none;
-        padding: 0 0 1 0;
-        overflow: auto scroll;
-    }
-
-    #placeholder-label {
-        height: 100%;
-        width: 100%;
-        color: $text-disabled;
-        content-align: center middle;
-    }
-
-    .user-message, .bot-message {
-        width: auto;
-        height: auto;
-        padding: 1;
-        margin: 1;
-    }
-
-    .user-message {
-        background: $secondary;
-    }
-
-    .bot-message {
-        background: $panel;
-    }
-
-    #input-container {
-        height: 20%;
-        width: 100%;
-        padding: 0 1 1 1;
-    }
-
-    #text-area {
-        border: none;
-        box-sizing: border-box;
-        margin: 0 1 0 0;
-    }
-
-    #send {
-        width: 6;
-        height: 3;
-        min-width: 4;
-        box-sizing: border-box;
-        margin: 0;
-        border: none;
-        text-align: center;
-        background: $primary;
-    }
-    #send:focus {
-        text-style: bold;
-    }
-
-    #clear {
-        width: 6;
-        height: 1;
-        min-width: 4;
-        box-sizing: border-box;
-        margin: 1 0 0 0;
-        border: none;
-        text-align: center;
-        background: $warning-darken-1;
-    }
-    #clear:focus {
-        text-style: bold;
-    }
+    The cache is owned by the message record rather than the widget, so it
+    survives the widget being unmounted and remounted as the chat scrolls.
     """
 
+    def __init__(self, message: dict, classes: str | None = None) -> None:
+        super().__init__(message["text"], classes=classes)
+        self._message = message
+
+    def update(self, content="", *, layout: bool = True) -> None:
+        self._message["lines"] = None
+        super().update(content, layout=layout)
+
+    def render_line(self, y: int) -> Strip:
+        size = self.size
+        visual_style = self.visual_style
+
+        # Selections are rendered into the strips, so bypass the cache while selecting
+        if self.text_selection is not None:
+            return super().render_line(y)
+
+        # Only the latest layout is kept, so resizes don't grow the cache
+        key = (size, visual_style)
+        cached = self._message["lines"]
+        if cached is not None and cached[0] == key:
+            strips = cached[1]
+        else:
+            strips = Visual.to_strips(self, self.visual, size.width, size.height, visual_style)
+            self._message["lines"] = (key, strips)
+
+        try:
+            return strips[y]
+        except IndexError:
+            return Strip.blank(size.width, visual_style.rich_style)
+
+
+class ChatPane(Container):
+    """Pane with a chat window and text input stacked vertically."""
+
     BINDINGS = [
         ('shift+tab', 'send_message', 'Send')
     ]
 
+    SCROLL_EVERY_N_CHUNKS = 8
+    RESIZE_DEBOUNCE = 0.05
+
+    # Estimated height of a message that has not been measured yet
+    DEFAULT_MESSAGE_HEIGHT = 3
+    # Rows above and below the viewport to keep mounted
+    OVERSCAN_ROWS = 20
+
     def __init__(self) -> None:
         super().__init__()
-        self.client = self.instantiate_client()
+        self._resize_timer = None
+        self._messages_width = None
+        self._spacer_heights = None
+
+        # Message records; only those near the viewport have a mounted widget
+        self._messages: list[dict] = []
+        self._mounted_messages: dict[int, CachedMessage] = {}
+        # Measured message heights keyed by (message index, window width)
+        self._message_heights: dict[tuple[int, int], int] = {}
+
+    @property
+    def client(self) -> AsyncOpenAI | None:
+        """The app's shared OpenAI client, or None until an API key is loaded."""
+        return self.app.openai_client
 
-    def instantiate_client(self) -> OpenAI | None:
-        if self.app.api_key:
-            self.client = OpenAI(api_key=self.app.api_key)
-        else:
-            self.client = None
-    
     def compose(self) -> ComposeResult:
         # Top 80% container: Scrollable chat messages
-        with VerticalScroll(id="messages-window"):
-            yield Label("Ask a query...", id="placeholder-label")
+        with VerticalScroll(id="messages-window") as self.messages_window:
+            self.placeholder_label = Label("Ask a query...", id="placeholder-label")
+            yield self.placeholder_label
+            # Spacers stand in for the messages clipped above and below the viewport
+            self.top_spacer = Static(classes="message-spacer")
+            yield self.top_spacer
+            self.bottom_spacer = Static(classes="message-spacer")
+            yield self.bottom_spacer
 
         # Bottom 20% container: Text input and buttons
-        with Horizontal(id="input-container"):
+        with Horizontal(id="input-container") as self.input_container:
             self.text_area = TextArea(id="text-area")
             yield self.text_area
             with Vertical(id="buttons-container"):
@@ -116,62 +107,192 @@ class ChatPane(Container):
                 self.clear_button = Button("CLR", id="clear")
                 yield self.clear_button
 
+    def on_mount(self) -> None:
+        self.watch(self.messages_window, "scroll_y", self._update_visible_messages, init=False)
+
     def on_resize(self, event: Resize) -> None:
         """
         Dynamically adjust child widget sizes when the container is resized.
         """
         def dynamic_size_input_bar():
-            input_container = self.query_one("#input-container")
-            parent_width = input_container.size.width
+            self._resize_timer = None
+            # Read every size up front, then apply the writes in a single pass
+            parent_width = self.input_container.size.width
+            current_width = self.text_area.outer_size.width
+            window_width = self.messages_window.size.width
 
             send_button_width = 6 + 1   # Width for the Send button + spacer
             text_area_width = max(0, parent_width - send_button_width)
 
-            self.text_area.styles.width = text_area_width
+            def apply_sizes():
+                if text_area_width != current_width:
+                    self.text_area.styles.width = text_area_width
+
+                # Message heights depend on the window width, so re-measure them if it changed
+                if window_width != self._messages_width:
+                    self._messages_width = window_width
+                    self._message_heights.clear()
+                self._update_visible_messages()
 
-        dynamic_size_input_bar()
+            self.call_after_refresh(apply_sizes)
+
+        # Debounce rapid resizes so the input bar is only resized once they settle
+        if self._resize_timer is not None:
+            self._resize_timer.stop()
+        self._resize_timer = self.set_timer(ChatPane.RESIZE_DEBOUNCE, dynamic_size_input_bar)
 
     @on(Button.Pressed, "#send")
     async def action_send_message(self) -> None:
         if not self.client:
-            client = self.instantiate_client()
-            if not client:
-                return
-            
-        input_field = self.query_one("#text-area")
+            return
+
+        input_field = self.text_area
         user_query = input_field.text
         if user_query:
             await self.add_message(user_query, True)
             input_field.clear()
 
-            response = await self.generate_bot_response(user_query)
-            
-            await self.add_message(response, False)
+            message_index = await self.add_message("", False)
+            await self.generate_bot_response(user_query, message_index)
 
     @on(Button.Pressed, "#clear")
     def clear_input(self) -> None:
         pass
 
-    async def add_message(self, text: str, is_user: bool) -> None:
+    async def add_message(self, text: str, is_user: bool) -> int:
         """
         Add a message to the scrollable container.
+
+        Returns:
+            int: The index of the new message.
+        """
+        self.placeholder_label.styles.display = "none"
+
+        message_window = self.messages_window
+
+        self._messages.append({"text": text.strip(), "is_user": is_user, "lines": None})
+        for pending_mount in self._update_visible_messages():
+            await pending_mount
+        # Scroll once the new message has been laid out, rather than forcing a layout now
+        self.call_after_refresh(message_window.scroll_end)
+
+        return len(self._messages) - 1
+
+    def update_message(self, index: int, text: str) -> None:
+        """
+        Replace the text of a message, updating its widget if it is mounted.
+        """
+        self._messages[index]["text"] = text.strip()
+        self._messages[index]["lines"] = None
+        message_box = self._mounted_messages.get(index)
+        if message_box is not None:
+            message_box.update(self._messages[index]["text"])
+            self.call_after_refresh(self._measure_messages)
+
+    def _make_message_widget(self, index: int) -> CachedMessage:
+        message = self._messages[index]
+        message_class = "user-message" if message["is_user"] else "bot-message"
+        return CachedMessage(message, classes=message_class)
+
+    def _message_height(self, index: int, width: int) -> int:
+        return self._message_heights.get((index, width), ChatPane.DEFAULT_MESSAGE_HEIGHT)
+
+    def _visible_range(self) -> tuple[int, int]:
+        """
+        Computes the range of messages that overlap the viewport, plus overscan.
+
+        Returns:
+            tuple[int, int]: The first and last (inclusive) visible message indexes.
+        """
+        message_window = self.messages_window
+        width = message_window.size.width
+        top = message_window.scroll_y - ChatPane.OVERSCAN_ROWS
+        bottom = message_window.scroll_y + message_window.size.height + ChatPane.OVERSCAN_ROWS
+
+        first, last = None, None
+        offset = 0
+        for index in range(len(self._messages)):
+            if offset > bottom:
+                break
+            height = self._message_height(index, width)
+            if offset + height >= top:
+                if first is None:
+                    first = index
+                last = index
+            offset += height
+
+        if first is None:
+            # Scrolled past the end, e.g. while the bottom spacer is shrinking
+            first = last = len(self._messages) - 1
+        return first, last
+
+    def _update_spacers(self, first: int, last: int) -> None:
+        width = self.messages_window.size.width
+        top = sum(self._message_height(index, width) for index in range(first))
+        bottom = sum(
+            self._message_height(index, width) for index in range(last + 1, len(self._messages))
+        )
+        # Only touch the style system when a spacer actually changes size.
+        if self._spacer_heights != (top, bottom):
+            self._spacer_heights = (top, bottom)
+            self.top_spacer.styles.height = top
+            self.bottom_spacer.styles.height = bottom
+
+    def _update_visible_messages(self, *args) -> list[AwaitMount]:
         """
-        placeholder_label = self.query_one("#placeholder-label")
-        placeholder_label.styles.display = "none"
+        Mount widgets for the messages in view and remove those scrolled out of range.
 
-        message_window = self.query_one("#messages-window")
+        Returns:
+            list[AwaitMount]: Optionally awaitable mounts for any newly mounted messages.
+        """
+        if not self._messages:
+            return []
+
+        message_window = self.messages_window
+        first, last = self._visible_range()
+
+        for index in [i for i in self._mounted_messages if i < first or i > last]:
+            self._mounted_messages.pop(index).remove()
+
+        # The mounted messages are contiguous, so new ones go either above or below them
+        lowest_mounted = min(self._mounted_messages, default=last + 1)
+        above, below = [], []
+        for index in range(first, last + 1):
+            if index not in self._mounted_messages:
+                message_box = self._make_message_widget(index)
+                self._mounted_messages[index] = message_box
+                (above if index < lowest_mounted else below).append(message_box)
+
+        pending_mounts = []
+        if above:
+            pending_mounts.append(message_window.mount_all(above, after=self.top_spacer))
+        if below:
+            pending_mounts.append(message_window.mount_all(below, before=self.bottom_spacer))
+
+        self._update_spacers(first, last)
+        self.call_after_refresh(self._measure_messages)
+        return pending_mounts
+
+    def _measure_messages(self) -> None:
+        """
+        Cache the rendered heights of mounted messages and resize the spacers to match.
+        """
+        if not self._mounted_messages:
+            return
 
-        message_class = "user-message" if is_user else "bot-message"
-        message_box = Static(text.strip(), classes=message_class)
+        width = self.messages_window.size.width
+        for index, message_box in self._mounted_messages.items():
+            if message_box.is_mounted:
+                # Sibling margins collapse, so each message adds a single row of margin
+                self._message_heights[(index, width)] = message_box.outer_size.height + 1
 
-        message_window.mount(message_box)
-        message_window.scroll_end()
+        self._update_spacers(min(self._mounted_messages), max(self._mounted_messages))
 
-    async def generate_bot_response(self, user_message: str) -> str:
+    async def generate_bot_response(self, user_message: str, message_index: int) -> str:
         """
-        Generate bot response.
+        Generate bot response, streaming it into the given message as it arrives.
         """
-        response = self.client.chat.completions.create(
+        stream = await self.client.chat.completions.create(
             messages=[
                 {
                     "role": "user",
@@ -179,7 +300,26 @@ class ChatPane(Container):
                 }
             ],
             model="gpt-4o",
+            stream=True,
         )
-        
-        assistant_message = response.choices[0].message.content
+
+        message_window = self.messages_window
+
+        assistant_message = ""
+        chunk_count = 0
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content or ""
+            if not delta:
+                continue
+
+            assistant_message += delta
+            self.update_message(message_index, assistant_message)
+
+            chunk_count += 1
+            if chunk_count % ChatPane.SCROLL_EVERY_N_CHUNKS == 0:
+                self.call_after_refresh(message_window.scroll_end)
+
+        self.call_after_refresh(message_window.scroll_end)
         return assistant_message
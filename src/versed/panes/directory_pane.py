@@ -1,11 +1,8 @@
 import asyncio
-from googleapiclient.discovery import build
-from pathlib import Path
 from rich.style import Style
 from rich.text import Text
 from textual import on
 from textual.app import ComposeResult
-from textual.await_complete import AwaitComplete
 from textual.containers import Container, Vertical
 from textual.css.query import NoMatches
 from textual.widgets import (
@@ -20,6 +17,7 @@ from textual.widgets import (
 from textual.widgets.directory_tree import DirEntry
 from textual.widgets._tree import TOGGLE_STYLE, TreeNode
 from typing import ClassVar
+from versed.gdrive_file_handler import GoogleDriveHandler
 from versed.screens.docs_screen import DocsScreen
 
 
@@ -46,106 +44,113 @@ class GoogleDriveTree(Tree):
     | `directory-tree--hidden` | Target hidden items in the directory structure. |
     """
 
-    DEFAULT_CSS = """
-    DirectoryTree {
-        
-        & > .directory-tree--folder {
-            text-style: bold;
-        }
-
-        & > .directory-tree--extension {
-            text-style: italic;
-        }
-
-        & > .directory-tree--hidden {
-            color: $text 50%;
-        }
-
-        &:ansi {
-        
-            & > .tree--guides {
-               color: transparent;              
-            }
-        
-            & > .directory-tree--folder {
-                text-style: bold;
-            }
-
-            & > .directory-tree--extension {
-                text-style: italic;
-            }
-
-            & > .directory-tree--hidden {
-                color: ansi_default;
-                text-style: dim;
-            }
-        }
-    }
-    """
-
-
     def __init__(self, label, id="google-drive-tree"):
         super().__init__(label, id=id)
 
-        credentials = self.app.credentials
-        service = build('drive', 'v3', credentials=credentials)
-
         self.mimetype_extensions = self.app.mimetype_extensions
+        # Shared with ingestion so Drive services built for listing are reused for downloads
+        self.drive_handler = self.app.vector_store.file_handler.get_gdrive_handler(self.app.credentials)
+        self._icon_prefixes: dict[tuple[str, Style], Text] = {}
+        # Bounds the folder listings in flight when several folders are expanded at once
+        self._sem = asyncio.Semaphore(GoogleDriveHandler.MAX_CONCURRENCY)
 
-        google_drive_structure = self.fetch_google_drive_files(service)
-        self.build_tree(self.root, google_drive_structure)
+    def on_mount(self) -> None:
+        # List the root folder in a worker owned by the tree, so mounting it doesn't block the UI
+        # and the listing is cancelled if the tree is removed
+        self.run_worker(self.load_google_drive_files(), exclusive=True)
+
+    async def load_google_drive_files(self) -> None:
         self.root.expand()
+        try:
+            await self.iter_drive("root", self.root)
+        except Exception as e:
+            self.log(f"Unable to list Google Drive: {e}")
+            self.notify(f"Unable to list Google Drive: {e}", severity="error")
 
-    def build_tree(self, parent: TreeNode, drive_tree: dict):
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded) -> None:
+        """
+        Load a folder's children the first time it is expanded.
+        """
+        node = event.node
+        if not node.data or node.data.get("type") != "folder" or node.data["loaded"]:
+            return
+
+        # Marked up front so expanding again mid-listing doesn't list the folder twice
+        node.data["loaded"] = True
+        # Listed in a worker so the tree stays responsive while Drive is queried
+        self.run_worker(self.load_folder(node), group="drive-listing")
+
+    async def load_folder(self, node: TreeNode) -> None:
+        try:
+            await self.iter_drive(node.data["id"], node)
+        except Exception as e:
+            # Leave the folder collapsed and unloaded, so expanding it again retries the listing
+            node.data["loaded"] = False
+            node.collapse()
+            self.log(f"Unable to list folder '{node.data['name']}': {e}")
+            self.notify(f"Unable to list folder '{node.data['name']}': {e}", severity="error")
+
+    async def iter_drive(self, folder_id: str, parent_node: TreeNode) -> None:
         """
-        Build the hierarchy of files and folders used to populate the tree.
+        List a folder, adding each page of its children to the tree as soon as it arrives.
         """
-        folders = []
-        files = []
+        page_token = None
+        first_page = True
+        while True:
+            async with self._sem:
+                files, page_token = await self.drive_handler.run_in_pool(
+                    self.drive_handler.list_folder_page, folder_id, page_token
+                )
+            if first_page:
+                # Clear the loading placeholder
+                parent_node.remove_children()
+                first_page = False
+
+            self.build_tree(parent_node, self.files_to_tree(files))
+            if not page_token:
+                break
 
-        for name, data in drive_tree.items():
-            if data.get("type") == "folder":
-                folders.append((name, data))
+    def build_tree(self, parent: TreeNode, drive_tree: dict):
+        """
+        Add a folder's files and folders to the tree under the given parent node.
+        """
+        # Sort once with folders first, then alphabetically within each group
+        items = sorted(
+            drive_tree.items(),
+            key=lambda item: (item[1]["type"] != "folder", item[0].lower())
+        )
+
+        for name, data in items:
+            if data["type"] == "folder":
+                # Folders get a placeholder until they are expanded
+                node = parent.add(
+                    Text(name),
+                    data={
+                        "name": name,
+                        "type": "folder",
+                        "id": data["id"],
+                        "path": f"gdrive://folder/{data['id']}",
+                        "loaded": False
+                    },
+                    expand=False,
+                )
+                node.add_leaf("loading…", data={"type": "placeholder"})
             else:
-                files.append((name, data))
-
-        # Sort folders and files alphabetically
-        folders.sort(key=lambda x: x[0].lower())
-        files.sort(key=lambda x: x[0].lower())
-
-        # Add folders to the tree first
-        for name, data in folders:
-            node = parent.add(f"{name}", expand=False)
-            node.data = {
-                "name": name,
-                "type": "folder",
-                "id": data["id"],
-                "path": f"gdrive://folder/{data['id']}"
-            }
-            self.build_tree(node, data["children"])
-
-        for name, data in files:
-            parent.add(
-                f"{name}",
-                data={
-                    "name": name,
-                    "type": "file",
-                    "id": data["id"],
-                    "path": f"gdrive://file/{data['id']}"
-                },
-                allow_expand=False,
-            )  
-
-    def fetch_google_drive_files(self, service, folder_id="root"):
+                parent.add(
+                    Text(name),
+                    data={
+                        "name": name,
+                        "type": "file",
+                        "id": data["id"],
+                        "path": f"gdrive://file/{data['id']}"
+                    },
+                    allow_expand=False,
+                )
+
+    def files_to_tree(self, files: list[dict]) -> dict:
         """
-        Recursively fetch Google Drive files and folders.
+        Convert a Google Drive listing into the structure used to populate the tree.
         """
-        results = service.files().list(
-            q=f"'{folder_id}' in parents and trashed = false",
-            fields="files(id, name, mimeType, parents)"
-        ).execute()
-
-        files = results.get('files', [])
         tree = {}
         for file in files:
             mime_type = file["mimeType"]
@@ -161,7 +166,6 @@ class GoogleDriveTree(Tree):
                 tree[file_name] = {
                     "id": file["id"],
                     "type": "folder",
-                    "children": self.fetch_google_drive_files(service, file["id"]),
                 }
             else:
                 # File handling
@@ -178,7 +182,6 @@ class GoogleDriveTree(Tree):
         else:
             return None
 
-    
     def render_label(self, node: TreeNode[DirEntry], base_style: Style, style: Style) -> Text:
         """Render a label for the given node.
 
@@ -199,7 +202,7 @@ class GoogleDriveTree(Tree):
             return node_label
 
         if node._allow_expand:
-            prefix = (
+            prefix = self._icon_prefix(
                 self.ICON_NODE_EXPANDED if node.is_expanded else self.ICON_NODE,
                 base_style + TOGGLE_STYLE,
             )
@@ -207,10 +210,7 @@ class GoogleDriveTree(Tree):
                 self.get_component_rich_style("directory-tree--folder", partial=True)
             )
         else:
-            prefix = (
-                self.ICON_FILE,
-                base_style,
-            )
+            prefix = self._icon_prefix(self.ICON_FILE, base_style)
             node_label.stylize_before(
                 self.get_component_rich_style("directory-tree--file", partial=True),
             )
@@ -229,38 +229,17 @@ class GoogleDriveTree(Tree):
         text = Text.assemble(prefix, node_label)
         return text
 
-
-class EmptyDirectoryTree(DirectoryTree):
-    async def watch_path(self) -> None:
-        self.clear_node(self.root)  # Prevent automatic reloading and just clear nodes.
-
-    async def _loader(self) -> None:
-        # Disable background filesystem loading.
-        pass
-
-    def _add_to_load_queue(self, node: TreeNode[DirEntry]) -> AwaitComplete:
+    def _icon_prefix(self, icon: str, style: Style) -> Text:
         """
-        Override to mark node as loaded without adding to the queue,
-        preventing the awaitable from hanging.
+        Get the styled icon prefix for a label, reusing one Text per icon and style.
         """
-        if node.data and not node.data.loaded:
-            node.data.loaded = True
-        
-        return AwaitComplete(asyncio.sleep(0))  # Return an already completed awaitable to prevent waiting.
-
-    def __init__(
-        self,
-        path: str | Path = ".",
-        *,
-        name: str | None = None,
-        id: str | None = None,
-        classes: str | None = None,
-        disabled: bool = False,
-    ) -> None:
-        super().__init__(path, name=name, id=id, classes=classes, disabled=disabled)
-
-        self.clear_node(self.root)
-    
+        key = (icon, style)
+        prefix = self._icon_prefixes.get(key)
+        if prefix is None:
+            prefix = Text(icon, style=style)
+            self._icon_prefixes[key] = prefix
+        return prefix
+
 
 class DirectoryPane(Container):
     """Tabbed pane containing DirectoryTrees for file sources and destination index."""
@@ -269,67 +248,12 @@ class DirectoryPane(Container):
         ("v", "view_docs", "View Documents")
     ]
     
-    DEFAULT_CSS = """
-    DirectoryPane {
-        width: 42;
-
-        #pane-container {
-            height: 1fr;
-            align: center middle;
-            background: $background-lighten-1;
-        }
-
-        #tabbed-content {
-            height: 0.5fr;
-        }
-
-        TabPane {
-            background: $background-lighten-1;
-            padding: 1;
-        }
-
-        #google-drive {
-            height: 1fr;
-            align: center middle;
-        }
-
-        #log-in {
-            width: 8;
-            height: 3;
-            text-align: center;
-        }
-        #log-in:focus {
-            text-style: bold;
-        }
-
-        #index-button {
-            width: 1fr;
-            height: 3;
-            margin: 1 3;
-            text-align: center;
-            background: $primary;
-        }
-        #index-button:focus {
-            text-style: bold;
-        }
-
-        #remove-button {
-            width: 1fr;
-            height: 3;
-            margin: 1 3;
-            text-align: center;
-            background: $error;
-        }
-        #remove-button:focus {
-            text-style: bold;
-        }
-    }
-    """
     def __init__(self) -> None:
         super().__init__()
         self.logged_in = False
         self.selected_node = None
         self.highlighted_collection = None
+        self.local_tree_mounted = False
 
     def compose(self) -> ComposeResult:
         with Vertical(id="pane-container"):
@@ -342,7 +266,8 @@ class DirectoryPane(Container):
                         id="collection-selector"
                     )
                 with TabPane("Local Files", id="local-files"):
-                    yield DirectoryTree(".", id="local-tree")
+                    # The local tree is mounted the first time this tab is shown
+                    pass
                 with TabPane("Google Drive", id="google-drive"):
                     self.log_in = Button("Log in", variant="success", id="log-in")
                     yield self.log_in
@@ -399,7 +324,7 @@ class DirectoryPane(Container):
         
         return None
 
-    def add_to_collection(self, collection, node):
+    async def add_to_collection(self, collection, node):
         # self.app.push_screen(DebugScreen(collection + " || " + str(type(collection))))
         if self.node_is_dir(node):
             pass
@@ -410,7 +335,7 @@ class DirectoryPane(Container):
                 "name": file_name,
                 "path": path
             }
-            self.app.vector_store.add_files_to_collection(collection=collection, files=[file])
+            await self.app.vector_store.add_files_to_collection(collection=collection, files=[file])
 
     @on(Button.Pressed, "#log-in")
     async def action_log_in(self) -> None:
@@ -421,7 +346,8 @@ class DirectoryPane(Container):
             google_tab.mount(GoogleDriveTree("Google Drive", id="gdrive-tree"))
         else:
             try:
-                self.app.auth_handler.get_credentials()
+                # The browser log-in flow blocks until it completes, so run it off the event loop
+                self.app.credentials = await asyncio.to_thread(self.app.auth_handler.get_credentials)
                 login_button.remove()
                 google_tab.mount(GoogleDriveTree("Google Drive", id="gdrive-tree"))
                 self.logged_in = True
@@ -431,9 +357,9 @@ class DirectoryPane(Container):
 
     @on(Button.Pressed, "#index-button")
     async def action_index(self) -> None:
-        def select_collection(collection_name: str | None) -> None:
+        async def select_collection(collection_name: str | None) -> None:
             if collection_name:
-                self.add_to_collection(collection=collection_name, node=self.selected_node)
+                await self.add_to_collection(collection=collection_name, node=self.selected_node)
 
         # Transition to the add collection screen
         self.app.push_screen("select_collection", select_collection)
@@ -458,6 +384,8 @@ class DirectoryPane(Container):
     @on(GoogleDriveTree.NodeSelected, "#gdrive-tree")
     async def action_handle_google_selection(self, event: DirectoryTree.NodeSelected) -> None:
         """Enable the button when a node is selected in the DirectoryTree."""
+        if event.node.data and event.node.data.get("type") == "placeholder":
+            return
         self.query_one("#index-button", Button).disabled = False
         self.selected_node = event.node
         # is_dir = self.node_is_dir(event.node)
@@ -482,8 +410,13 @@ class DirectoryPane(Container):
             add_to_index_button.display = "block"
             remove_collection_button.display = "none"
 
-        # Handle index button enablement
+        # Scan the working directory only once the Local Files tab is first shown
         tab_pane = event.pane
+        if tab_pane.id == "local-files" and not self.local_tree_mounted:
+            self.local_tree_mounted = True
+            await tab_pane.mount(DirectoryTree(".", id="local-tree"))
+
+        # Handle index button enablement
         if tab_pane.id in ["local-files", "google-drive"]:
             add_to_index_button.disabled = True
             try:
@@ -498,9 +431,20 @@ class DirectoryPane(Container):
         """
         collections_selector = self.query_one("#collection-selector")
         selected_index = collections_selector.highlighted
+        selected_collection = None
         if selected_index is not None:
             selected_option = collections_selector.get_option_at_index(selected_index)
             selected_collection = selected_option.value
+        else:
+            # Fall back to the default collection, or the first one if it has been removed
+            vector_store = self.app.vector_store
+            names = vector_store.get_collection_names()
+            if names:
+                default_name = self.app.DEFAULT_COLLECTION_NAME
+                selected_collection = default_name if vector_store.has_collection(default_name) else names[0]
+
+        # Fetch stats off the event loop so the UI stays responsive
+        stats_json = await asyncio.to_thread(self.app.vector_store.get_collection_stats_json, selected_collection)
         
         # Push the modal screen with retrieved documents
-        await self.app.push_screen(DocsScreen(selected_collection))
+        await self.app.push_screen(DocsScreen(selected_collection, stats_json))
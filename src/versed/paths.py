@@ -0,0 +1,23 @@
+from functools import lru_cache
+from pathlib import Path
+from platformdirs import user_data_dir
+
+
+@lru_cache(maxsize=None)
+def ensure_data_dir(app_name: str, subdir: str | None = None) -> Path:
+    """
+    Gets the app's data directory (or a subdirectory of it), creating it on first use.
+
+    Args:
+        app_name (str): The name of the app.
+        subdir (str | None): An optional subdirectory within the data directory.
+
+    Returns:
+        Path: The data directory.
+    """
+    data_dir = Path(user_data_dir(app_name))
+    if subdir:
+        data_dir = data_dir / subdir
+
+    data_dir.mkdir(parents=True, exist_ok=True)
+    return data_dir
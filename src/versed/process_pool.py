@@ -0,0 +1,29 @@
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import os
+
+
+def create_process_pool() -> ProcessPoolExecutor | None:
+    """
+    Creates the pool of worker processes shared by file parsing and text splitting. Its size
+    can be set with the VERSED_WORKERS environment variable, where 0 disables the pool so the
+    work runs on threads instead.
+
+    Returns:
+        ProcessPoolExecutor | None: The pool, or None when disabled.
+    """
+    workers = int(os.environ.get("VERSED_WORKERS", max((os.cpu_count() or 1) - 1, 1)))
+    if workers <= 0:
+        return None
+    # Workers are only started when work is first submitted
+    return ProcessPoolExecutor(max_workers=workers, mp_context=_process_context())
+
+
+def _process_context():
+    """
+    Gets the start method for worker processes. Forking a process that already runs threads
+    can copy locks mid-use into the child, so workers start from a clean interpreter instead.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
@@ -24,17 +24,6 @@ class Canvas(Container):
 class ChatScreen(Screen):
     """Main screen containing the layout."""
 
-    DEFAULT_CSS = """
-    Canvas {
-        width: 100%;
-        height: 100%;
-    }
-
-    Footer {
-        dock: bottom;
-    }
-    """  
-
     def compose(self) -> ComposeResult:
         yield Header()
         yield Canvas()
@@ -13,62 +13,6 @@ from textual.widgets import (
 class AddCollectionScreen(ModalScreen):
     """Screen to add a new collection."""
 
-    DEFAULT_CSS = """
-    AddCollectionScreen {
-        align: center middle;
-    }
-
-    #dialog {
-        padding: 1 1;
-        width: 50%;
-        height: auto;
-        border: thick $background 50%;
-        background: $surface 90%;
-    }
-
-    #name_label {
-        height: 1;
-        padding-left: 1;
-        padding-right: 1;
-        content-align: left middle;
-    }
-
-    Input {
-        height: 1fr;
-        margin-bottom: 1;
-        content-align: left middle;
-    }
-
-    #submit {
-        width: 100%;
-        margin-left: 1;
-        margin-right: 1;
-        margin-bottom: 1;
-        box-sizing: border-box;
-        content-align: center middle;
-    }
-    #submit:focus {
-        text-style: bold;
-    }
-
-    #back {
-        width: 100%;
-        margin-left: 1;
-        margin-right: 1;
-        box-sizing: border-box;
-        content-align: center middle;
-    }
-    #back:focus {
-        text-style: bold;
-    }
-
-    .success {
-        color: green;
-        margin-top: 1;
-        content-align: center middle;
-    }
-    """
-
     def compose(self) -> ComposeResult:
         yield Vertical(
             Label("Collection Name", id="name_label"),
@@ -13,69 +13,13 @@ from textual.widgets.option_list import Option
 class SelectCollectionScreen(ModalScreen):
     """Screen to select an existing collection."""
 
-    DEFAULT_CSS = """
-    SelectCollectionScreen {
-        align: center middle;
-    }
-
-    #dialog {
-        padding: 1 1;
-        width: 50%;
-        height: auto;
-        border: thick $background 50%;
-        background: $surface 90%;
-    }
-
-    #select_label {
-        height: 1;
-        padding-left: 1;
-        padding-right: 1;
-        margin-bottom: 1;
-        content-align: left middle;
-    }
-
-    OptionList {
-        margin-bottom: 1;
-    }
-
-    #use_selected {
-        width: 100%;
-        margin-left: 1;
-        margin-right: 1;
-        margin-bottom: 1;
-        box-sizing: border-box;
-        content-align: center middle;
-    }
-    #use_selected:focus {
-        text-style: bold;
-    }
-
-    #add_new_collection {
-        width: 100%;
-        margin-left: 1;
-        margin-right: 1;
-        box-sizing: border-box;
-        content-align: center middle;
-    }
-    #add_new_collection:focus {
-        text-style: bold;
-    }
-
-    .error {
-        color: red;
-        margin-top: 1;
-        content-align: center middle;
-    }
-    """
-
-    def __init__(self) -> None:
-        super().__init__()
-        self.options = [Option(name, id=f"{name}") for name in self.app.collection_names]
-
     def compose(self) -> ComposeResult:
         yield Vertical(
             Label("Select a Collection", id="select_label"),
-            OptionList(*self.options, id="collection_option_list"),
+            OptionList(
+                *(Option(name, id=name) for name in self.app.collection_names),
+                id="collection_option_list"
+            ),
             Button("Use Selected", variant="success", id="use_selected"),
             Button("Add a New Collection", variant="primary", id="add_new_collection"),
             id="dialog",
@@ -1,4 +1,3 @@
-import json
 from textual import on
 from textual.app import ComposeResult
 from textual.containers import Vertical
@@ -7,43 +6,14 @@ from textual.widgets import Button, Static
 
 class DocsScreen(ModalScreen):
 
-    DEFAULT_CSS = """
-    DocsScreen {
-        align: center middle;
-    }
-
-    #dialog {
-        grid-size: 2;
-        grid-gutter: 1 2;
-        grid-rows: 1fr 3;
-        padding: 0 1;
-        width: 60;
-        height: 11;
-        border: thick $background 50%;
-        background: $surface 90%;
-    }
-
-    #back {
-        dock: bottom;
-        width: 100%;
-        margin-left: 3;
-        margin-right: 3;
-        box-sizing: border-box;
-        content-align: center middle;
-    }
-    #back:focus {
-        text-style: bold;
-    }
-    """
-
-    def __init__(self, collection_name):
+    def __init__(self, collection_name, stats_json):
         super().__init__()
         self.collection_name = collection_name
+        self.stats_json = stats_json
 
     def compose(self) -> ComposeResult:
         # Display each document on a new line.
-        stats = self.app.vector_store.get_collection_stats(self.collection_name)
-        content = json.dumps(stats) if stats else "No documents found."
+        content = self.stats_json if self.stats_json else "No documents found."
         yield Vertical(
             Static(content),
             Button("Close", variant="primary", id="back"),
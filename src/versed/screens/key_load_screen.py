@@ -14,71 +14,12 @@ from versed.secret_handler import SecretHandler
 class LoadKeyScreen(ModalScreen):
     """Screen to select a saved API key."""
 
-    DEFAULT_CSS = """
-    LoadKeyScreen {
-        align: center middle;
-    }
-
-    #dialog {
-        padding: 1 1;
-        width: 50%;
-        height: auto;
-        border: thick $background 50%;
-        background: $surface 90%;
-    }
-
-    #select_label {
-        height: 1;
-        padding-left: 1;
-        padding-right: 1;
-        margin-bottom: 1;
-        content-align: left middle;
-    }
-
-    OptionList {
-        margin-bottom: 1;
-    }
-
-    #use_selected {
-        width: 100%;
-        margin-left: 1;
-        margin-right: 1;
-        margin-bottom: 1;
-        box-sizing: border-box;
-        content-align: center middle;
-    }
-    #use_selected:focus {
-        text-style: bold;
-    }
-
-    #add_new_key {
-        width: 100%;
-        margin-left: 1;
-        margin-right: 1;
-        box-sizing: border-box;
-        content-align: center middle;
-    }
-    #add_new_key:focus {
-        text-style: bold;
-    }
-
-    .error {
-        color: red;
-        margin-top: 1;
-        content-align: center middle;
-    }
-    """
-
-    def __init__(self) -> None:
-        super().__init__()
-        self.secret_handler = SecretHandler(self.app.app_name)
-        self.aliases = self.secret_handler.get_aliases()
-        self.options = [Option(alias, id=f"{alias}") for alias in self.aliases]
-
     def compose(self) -> ComposeResult:
+        # Saved keys are looked up when the screen is built, not when it is constructed
+        aliases = SecretHandler(self.app.app_name).get_aliases()
         yield Vertical(
             Label("Select an API Key", id="select_label"),
-            OptionList(*self.options, id="alias_option_list"),
+            OptionList(*(Option(alias, id=alias) for alias in aliases), id="alias_option_list"),
             Button("Use Selected", variant="success", id="use_selected"),
             Button("Add a New Key", variant="primary", id="add_new_key"),
             id="dialog",
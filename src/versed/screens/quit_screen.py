@@ -10,37 +10,6 @@ from textual.widgets import (
 class QuitScreen(ModalScreen):
     """Screen with a dialog to quit."""
 
-    DEFAULT_CSS = """
-    QuitScreen {
-        align: center middle;
-    }
-
-    #dialog {
-        grid-size: 2;
-        grid-gutter: 1 2;
-        grid-rows: 1fr 3;
-        padding: 0 1;
-        width: 60;
-        height: 11;
-        border: thick $background 50%;
-        background: $surface 90%;
-    }
-
-    #question {
-        column-span: 2;
-        height: 1fr;
-        width: 1fr;
-        content-align: center middle;
-    }
-
-    Button {
-        width: 100%;
-    }
-    Button:focus {
-        text-style: bold;
-    }
-    """
-
     def compose(self) -> ComposeResult:
         yield Grid(
             Label("Are you sure you want to quit?", id="question"),
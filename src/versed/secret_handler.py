@@ -1,32 +1,41 @@
 from cryptography.fernet import Fernet
 import keyring
-from pathlib import Path
-from platformdirs import user_data_dir
+import os
+
+from versed.paths import ensure_data_dir
 
 
 class SecretHandler:
+
+    # Fernet instances keyed by keyring service name, shared across handler instances
+    _fernet_cache = {}
+
     def __init__(self, app_name) -> None:
         self.app_name = app_name
         self.service_name = f"{self.app_name}_key"
-        self.data_dir = Path(user_data_dir(self.app_name)) / "keys"
-
         self.google_credential_name = "credentials_GCC.enc"
 
         try:
-            self.data_dir.mkdir(parents=True, exist_ok=True)
+            self.data_dir = ensure_data_dir(self.app_name, "keys")
         except Exception as e:
-            raise RuntimeError(f"Failed to create directory {self.data_dir}: {e}")
+            raise RuntimeError(f"Failed to create keys directory for {self.app_name}: {e}")
 
     def get_fernet_key(self):
         """
         Retrieve or generate a secure key.
         """
+        fernet = SecretHandler._fernet_cache.get(self.service_name)
+        if fernet is not None:
+            return fernet
+
         try:
             key = keyring.get_password(self.service_name, "encryption_key")
             if key is None:
                 key = Fernet.generate_key().decode()
                 keyring.set_password(self.service_name, "encryption_key", key)
-            return Fernet(key.encode())
+            fernet = Fernet(key.encode())
+            SecretHandler._fernet_cache[self.service_name] = fernet
+            return fernet
         except Exception as e:
             raise RuntimeError(f"Failed to access keyring: {e}")
 
@@ -35,8 +44,7 @@ class SecretHandler:
             api_key_file = self.data_dir / f"{alias}_API.enc"
             fernet = self.get_fernet_key()
             encrypted_key = fernet.encrypt(api_key.encode())
-            with open(api_key_file, "wb") as f:
-                f.write(encrypted_key)
+            api_key_file.write_bytes(encrypted_key)
         except OSError as e:
             raise RuntimeError(f"Failed to write to file '{api_key_file}': {e}")
 
@@ -44,8 +52,12 @@ class SecretHandler:
         """
         Retrieve all available aliases from the keys directory.
         """
-        filenames = [file.stem for file in self.data_dir.glob("*_API.enc")]
-        return [f.rstrip("_API") for f in filenames]
+        suffix = "_API.enc"
+        with os.scandir(self.data_dir) as entries:
+            return [
+                entry.name[:-len(suffix)] for entry in entries
+                if entry.name.endswith(suffix) and entry.is_file()
+            ]
 
     def load_api_key(self, alias) -> str:
         """
@@ -56,8 +68,7 @@ class SecretHandler:
             raise FileNotFoundError(f"No key found with alias '{alias}'.")
         try:
             fernet = self.get_fernet_key()
-            with open(api_key_file, "rb") as f:
-                encrypted_key = f.read()
+            encrypted_key = api_key_file.read_bytes()
             return fernet.decrypt(encrypted_key).decode()
         except Exception as e:
             raise RuntimeError(f"Failed to decrypt API key for alias '{alias}': {e}")
@@ -67,8 +78,7 @@ class SecretHandler:
             credential_file = self.data_dir / self.google_credential_name
             fernet = self.get_fernet_key()
             encrypted_key = fernet.encrypt(credential.encode())
-            with open(credential_file, "wb") as f:
-                f.write(encrypted_key)
+            credential_file.write_bytes(encrypted_key)
         except OSError as e:
             raise RuntimeError(f"Failed to write to file '{credential_file}': {e}")
         
@@ -81,8 +91,7 @@ class SecretHandler:
             raise FileNotFoundError(f"No credential file found.")
         try:
             fernet = self.get_fernet_key()
-            with open(credential_file, "rb") as f:
-                encrypted_key = f.read()
+            encrypted_key = credential_file.read_bytes()
             return fernet.decrypt(encrypted_key).decode()
         except Exception as e:
             raise RuntimeError(f"Failed to decrypt credential file: {e}")
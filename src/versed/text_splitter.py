@@ -0,0 +1,78 @@
+from functools import lru_cache
+from typing import List
+
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+# Separators tried in order when splitting text, from paragraph breaks down to single characters
+SPLITTER_SEPARATORS = [
+    ".\n\n",
+    "\n\n",
+    ".\n",
+    "\n",
+    ".",
+    ",",
+    " ",
+    "\u200b",  # Zero-width space
+    "\uff0c",  # Fullwidth comma
+    "\u3001",  # Ideographic comma
+    "\uff0e",  # Fullwidth full stop
+    "\u3002",  # Ideographic full stop
+    "",
+]
+
+
+class _WindowingTextSplitter(RecursiveCharacterTextSplitter):
+    """
+    RecursiveCharacterTextSplitter that cuts oversized runs with none of its separators
+    (e.g. long unbroken strings from PDF extraction) straight into fixed windows,
+    instead of splitting them into single characters and merging them back one by one.
+    """
+
+    def _split_text(self, text: str, separators: List[str]) -> List[str]:
+        if (
+            len(text) > self._chunk_size
+            and "" in separators
+            and not any(separator and separator in text for separator in separators)
+        ):
+            return self._split_windows(text)
+        return super()._split_text(text, separators)
+
+    def _split_windows(self, text: str) -> List[str]:
+        # Same chunks that merging the text's characters back together would produce
+        step = self._chunk_size - self._chunk_overlap
+        chunks = []
+        start = 0
+        while True:
+            chunk = text[start:start + self._chunk_size].strip()
+            if chunk:
+                chunks.append(chunk)
+            if start + self._chunk_size >= len(text):
+                return chunks
+            start += step
+
+
+@lru_cache(maxsize=8)
+def _make_splitter(chunk_size: int, overlap: int) -> RecursiveCharacterTextSplitter:
+    """
+    Gets a text splitter for a chunk size and overlap, built once and reused across files.
+    """
+    return _WindowingTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=overlap,
+        length_function=len,
+        is_separator_regex=False,
+        separators=SPLITTER_SEPARATORS,
+    )
+
+
+def split_text(text: str, chunk_size: int, overlap: int) -> List[str]:
+    """
+    Splits text into chunks. This module only imports the splitter, so worker processes that
+    run this function start quickly.
+    """
+    # Text that already fits in one chunk comes back from the splitter as itself, stripped,
+    # so skip its separator scans entirely
+    if len(text) <= chunk_size:
+        stripped = text.strip()
+        return [stripped] if stripped else []
+    return _make_splitter(chunk_size, overlap).split_text(text)
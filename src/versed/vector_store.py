@@ -1,78 +1,396 @@
+import asyncio
+import hashlib
 import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import aclosing
 from typing import Dict, List
 
-from langchain_text_splitters import RecursiveCharacterTextSplitter
-from openai import OpenAI
-from pymilvus import MilvusClient, FieldSchema, DataType, CollectionSchema
+from openai import APIConnectionError, APIStatusError, AsyncOpenAI, InternalServerError, RateLimitError
+import orjson
+from pymilvus import MilvusClient, MilvusException, FieldSchema, DataType, CollectionSchema
+from versed.embedding_cache import EmbeddingCache
 from versed.file_handler import FileHandler
+from versed.text_splitter import split_text
+
+# Embeddings errors that are worth retrying: rate limits, server errors, dropped connections and timeouts
+_RETRYABLE_EMBED_ERRORS = (RateLimitError, InternalServerError, APIConnectionError)
+
+
+def _retry_delay(attempt: int, base: float, cap: float, error: Exception | None = None) -> float:
+    """
+    Gets the backoff before a retry: exponential with full jitter, so concurrent callers don't
+    retry in lockstep, but never shorter than a Retry-After the server sent.
+    """
+    delay = random.uniform(0, min(cap, base * 2 ** attempt))
+    if isinstance(error, APIStatusError):
+        try:
+            delay = max(delay, min(cap, float(error.response.headers.get("retry-after", 0))))
+        except ValueError:
+            pass
+    return delay
+
+
+# Milvus clients keyed by URI, shared by every VectorStore in the process
+_CLIENTS: Dict[str, MilvusClient] = {}
+
+
+def get_milvus_client(uri: str) -> MilvusClient:
+    """
+    Gets the shared Milvus client for a URI, connecting on first use.
+    """
+    client = _CLIENTS.get(uri)
+    if client is None:
+        client = _CLIENTS[uri] = MilvusClient(uri=uri)
+    return client
+
 
 class VectorStore:
 
+    STATS_TTL = 5.0
+    # Number of chunks sent per embeddings request (the API accepts up to 2048 inputs and
+    # 300k tokens; 256 chunks of at most 500 characters stays far below the token cap)
+    EMBED_BATCH_SIZE = 256
+    # Texts shorter than this are split inline, as shipping them to a worker costs more
+    CHUNK_IN_PROCESS_MIN_SIZE = 64 * 1024
+    # Maximum number of embeddings requests in flight at once
+    EMBED_CONCURRENCY = 16
+    # Attempts per embeddings request on transient errors, and the initial and largest backoff in seconds
+    EMBED_MAX_RETRIES = 6
+    EMBED_RETRY_BASE_DELAY = 0.5
+    EMBED_RETRY_MAX_DELAY = 30.0
+    # Attempts per Milvus insert before the error is raised, and the initial and largest backoff in seconds
+    INSERT_MAX_RETRIES = 3
+    INSERT_RETRY_BASE_DELAY = 0.2
+    INSERT_RETRY_MAX_DELAY = 5.0
+    # Embeddings are truncated server-side to the schema's vector width
+    EMBEDDING_DIM = 1024
+    EMBEDDING_MODEL = "text-embedding-3-small"
+    # Seconds to wait after a metadata change before writing, so bursts are coalesced
+    METADATA_FLUSH_DELAY = 0.5
+    # Number of embedded chunks written per Milvus insert
+    INSERT_BATCH_SIZE = 1024
+    # Version of the metadata file; older files have migrations applied once on startup
+    METADATA_VERSION = 1
+
     def __init__(
         self,
         app,
         data_dir,
         default_collection_name,
-        google_credentials
+        google_credentials,
+        milvus_client: MilvusClient | None = None,
+        process_pool: ProcessPoolExecutor | None = None
     ):
         self.app = app
+        # Worker processes for splitting large texts, owned and shut down by the app
+        self.process_pool = process_pool
 
         milvus_db_path = data_dir / "milvus.db"
         self.milvus_metadata_path = data_dir / "metadata.json"
+        self.embedding_cache = EmbeddingCache(
+            data_dir / "embeddings.db", VectorStore.EMBEDDING_MODEL, VectorStore.EMBEDDING_DIM
+        )
+        # Embedding requests still awaiting a response, keyed by cache key
+        self._embeddings_in_flight: Dict[bytes, asyncio.Future] = {}
         self.milvus_uri = f"{milvus_db_path}"
 
         self.fields = [
             FieldSchema(name="id", dtype=DataType.INT64, is_primary=True),
             FieldSchema(name="text", dtype=DataType.VARCHAR, max_length=2000),
-            FieldSchema(name="embedding", dtype=DataType.FLOAT_VECTOR, dim=1024),
+            FieldSchema(name="embedding", dtype=DataType.FLOAT_VECTOR, dim=VectorStore.EMBEDDING_DIM),
         ]
 
-        self.milvus_client = MilvusClient(uri=self.milvus_uri)
-        self.metadata = { "collections": [] }
-
-        if not self.milvus_client.list_collections():
-            if not self.milvus_client.has_collection(collection_name=default_collection_name):
-                self.add_collection(collection_name=default_collection_name, description="Default project for Versed.")
+        self.default_collection_name = default_collection_name
+        self.milvus_client = milvus_client or get_milvus_client(self.milvus_uri)
+        # Held for every Milvus call, so only one thread uses the client at a time: inserts and
+        # deletes run on worker threads while the UI reads stats and manages collections
+        self._milvus_lock = threading.RLock()
+        self.metadata = { "version": VectorStore.METADATA_VERSION, "collections": [] }
+        self._metadata_dirty = False
+        self._metadata_flush_handle = None
+        self._metadata_seq = 0
+        self._metadata_written_seq = 0
+        self._metadata_write_lock = threading.Lock()
+
+        # Collection stats are memoised per collection name as (timestamp, stats)
+        self._stats_cache = {}
+        # Serialised stats keyed by collection name as (stats, json), reused while the stats are unchanged
+        self._stats_json_cache = {}
+
+        # The names of the collections held by Milvus are the one record of which collections
+        # exist. This is the only listing made at startup; add/remove_collection keep it in step
+        self.refresh_collections()
+        if not self._collections:
+            self.add_collection(collection_name=default_collection_name, description="Default project for Versed.")
         else:
             # Load metadata
-            with self.milvus_metadata_path.open("r") as file:
-                try:
-                    self.metadata = json.loads(file.read())
-                except json.decoder.JSONDecodeError:
-                    # Metadata is corrupted, delete all collections and start fresh?
-                    self.metadata = { "collections": [] }
+            try:
+                with self.milvus_metadata_path.open("rb") as file:
+                    self.metadata = orjson.loads(file.read())
+            except (FileNotFoundError, orjson.JSONDecodeError):
+                # Metadata is missing or corrupted; its collection entries are rebuilt below
+                self.metadata = { "collections": [] }
+            self._reconcile_metadata()
+            self._migrate_metadata()
 
         self.openai_client = None
+        self._embeddings_client = None
         self.google_credentials = google_credentials
 
-        self.file_handler = FileHandler(self.google_credentials)
+        self.file_handler = FileHandler(self.google_credentials, process_pool)
 
-    def initialise_openai_client(self, api_key) -> OpenAI | None:
-        self.openai_client = OpenAI(api_key=self.app.api_key)
+    def initialise_openai_client(self, openai_client: AsyncOpenAI) -> None:
+        # The app's client is shared so embeddings reuse the chat's connection pool
+        self.openai_client = openai_client
+        # Embeddings requests back off in _create_embeddings, so the SDK's own retries are
+        # turned off for them rather than stacking a second retry policy underneath
+        self._embeddings_client = openai_client.with_options(max_retries=0)
 
     def close_client(self) -> None:
-        self.milvus_client.close()
+        if self._metadata_flush_handle is not None:
+            self._metadata_flush_handle.cancel()
+            self._metadata_flush_handle = None
+        self.flush_metadata()
+        self.embedding_cache.close()
+        with self._milvus_lock:
+            if _CLIENTS.get(self.milvus_uri) is self.milvus_client:
+                del _CLIENTS[self.milvus_uri]
+            self.milvus_client.close()
+
+    def _call_milvus(self, call):
+        """
+        Runs a call against the persistent Milvus client, reconnecting and trying once more
+        if it fails, rather than pinging the connection before every call.
+
+        Args:
+            call: A callable taking the Milvus client.
+
+        Returns:
+            The result of `call`.
+        """
+        with self._milvus_lock:
+            client = self.milvus_client
+            try:
+                return call(client)
+            except MilvusException:
+                self._reconnect(client)
+                return call(self.milvus_client)
+
+    def _reconnect(self, failed_client: MilvusClient) -> None:
+        """
+        Replaces a Milvus client whose call failed with a fresh connection. Calls fail on worker
+        threads too, so only the first caller to see a given client fail replaces it.
+        """
+        with self._milvus_lock:
+            if self.milvus_client is not failed_client:
+                return
+            if _CLIENTS.get(self.milvus_uri) is failed_client:
+                del _CLIENTS[self.milvus_uri]
+            # Connected before the failed client is dropped, so if the server is still down this
+            # raises with the failed client left in place, and the next attempt reconnects again
+            self.milvus_client = get_milvus_client(self.milvus_uri)
+            try:
+                failed_client.close()
+            except Exception:
+                # The connection is already broken, so there may be nothing left to close
+                pass
+            # Collections may have changed while the connection was down
+            self.refresh_collections()
 
     def update_metadata(self) -> bool:
         """
-        Updates the metadata file.
+        Marks the metadata as changed. The file is written by a flush that is debounced on the
+        event loop (or on the next flush_metadata call), so bursts of updates cost one write.
+
+        Returns
+            bool: A boolean indicating whether the operation succeeded.
+        """
+        self._metadata_dirty = True
+        if self._metadata_flush_handle is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # No event loop to debounce on; the next explicit flush writes the changes
+                return True
+            self._metadata_flush_handle = loop.call_later(
+                VectorStore.METADATA_FLUSH_DELAY, self._flush_metadata_later
+            )
+        return True
+
+    def flush_metadata(self) -> bool:
+        """
+        Writes the metadata file if it has changed since it was last written.
 
         Returns
             bool: A boolean indicating whether the operation succeeded.
         """
-        with self.milvus_metadata_path.open("w") as file:
-            file.write(json.dumps(self.metadata) + "\n")
+        if self._metadata_dirty:
+            self._write_metadata(*self._serialise_metadata())
         return True
 
+    async def flush_metadata_async(self) -> bool:
+        """
+        Writes the metadata file if it has changed, without blocking the event loop.
+
+        Returns
+            bool: A boolean indicating whether the operation succeeded.
+        """
+        if self._metadata_dirty:
+            await asyncio.to_thread(self._write_metadata, *self._serialise_metadata())
+        return True
+
+    def _flush_metadata_later(self) -> None:
+        self._metadata_flush_handle = None
+        if self._metadata_dirty:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(None, self._write_metadata, *self._serialise_metadata())
+            future.add_done_callback(self._on_metadata_written)
+
+    def _on_metadata_written(self, future: asyncio.Future) -> None:
+        if future.cancelled() or future.exception() is None:
+            return
+        # The snapshot was not saved, so mark the metadata dirty again and retry after the delay
+        self.app.log(f"Unable to write metadata: {future.exception()}")
+        self.update_metadata()
+
+    def _serialise_metadata(self) -> tuple[int, bytes]:
+        """
+        Snapshots the metadata on the calling thread, so a background write never sees it mid-update.
+
+        Returns
+            tuple[int, bytes]: The snapshot's sequence number, and the metadata as JSON.
+        """
+        self._metadata_dirty = False
+        self._metadata_seq += 1
+        return self._metadata_seq, orjson.dumps(self.metadata, option=orjson.OPT_APPEND_NEWLINE)
+
+    def _write_metadata(self, seq: int, data: bytes) -> None:
+        with self._metadata_write_lock:
+            # A newer snapshot may already have been written by another flush
+            if seq <= self._metadata_written_seq:
+                return
+            # Write to a temporary file and swap it in, so a crash never leaves a partial file
+            tmp_path = self.milvus_metadata_path.with_suffix(".tmp")
+            try:
+                tmp_path.write_bytes(data)
+                os.replace(tmp_path, self.milvus_metadata_path)
+            except OSError:
+                # Keep the changes pending so the next flush writes them
+                self._metadata_dirty = True
+                raise
+            self._metadata_written_seq = seq
+
+    def invalidate_collections(self) -> None:
+        """
+        Marks cached collection stats as stale.
+        """
+        self._stats_cache.clear()
+        self._stats_json_cache.clear()
+
+    def refresh_collections(self) -> None:
+        """
+        Reloads the names of the collections held by Milvus, on startup and after reconnecting.
+        """
+        with self._milvus_lock:
+            self._collections = set(self.milvus_client.list_collections())
+        self.invalidate_collections()
+
+    def _reconcile_metadata(self) -> None:
+        """
+        Brings the metadata's collection entries in line with the collections Milvus holds,
+        dropping entries for collections that are gone and adding any that are missing.
+        """
+        collections = [
+            c for c in self.metadata["collections"] if c["collection_name"] in self._collections
+        ]
+        described = {c["collection_name"] for c in collections}
+        for collection_name in sorted(self._collections - described):
+            collections.append({"collection_name": collection_name, "files": []})
+
+        if collections != self.metadata["collections"]:
+            self.metadata["collections"] = collections
+            self.update_metadata()
+            self.flush_metadata()
+
+    def _migrate_metadata(self) -> None:
+        """
+        Upgrades collections made by older versions, recording the new version in the metadata
+        so each migration runs once rather than on every startup.
+        """
+        version = self.metadata.get("version", 0)
+        if version >= VectorStore.METADATA_VERSION:
+            return
+
+        if version < 1:
+            # Collections created before indexes were attached would otherwise be brute-force scanned
+            with self._milvus_lock:
+                for collection_name in self._collections:
+                    if not self.milvus_client.list_indexes(collection_name=collection_name):
+                        self.milvus_client.create_index(
+                            collection_name=collection_name,
+                            index_params=self._index_params()
+                        )
+
+        self.metadata["version"] = VectorStore.METADATA_VERSION
+        self.update_metadata()
+        self.flush_metadata()
+
     def get_collection_names(self) -> List:
-        return [x["collection_name"] for x in self.metadata["collections"]]
+        return sorted(self._collections)
+
+    def has_collection(self, collection_name) -> bool:
+        """
+        Checks whether a collection exists, using the known collection names rather than Milvus.
+        """
+        return collection_name in self._collections
     
     def get_collection_stats(self, collection_name) -> Dict:
-        if collection_name in self.get_collection_names():
-            return self.milvus_client.get_collection_stats(collection_name)
+        if self.has_collection(collection_name):
+            cached = self._stats_cache.get(collection_name)
+            now = time.monotonic()
+            if cached and now - cached[0] < VectorStore.STATS_TTL:
+                return cached[1]
+
+            stats = self._call_milvus(lambda client: client.get_collection_stats(collection_name))
+            self._stats_cache[collection_name] = (now, stats)
+            return stats
         else:
             return {}
 
+    def get_collection_stats_json(self, collection_name) -> str | None:
+        """
+        Gets the stats of a collection serialised as JSON, or None if there are none.
+        """
+        stats = self.get_collection_stats(collection_name)
+        if not stats:
+            return None
+
+        cached = self._stats_json_cache.get(collection_name)
+        if cached and cached[0] is stats:
+            return cached[1]
+
+        stats_json = json.dumps(stats)
+        self._stats_json_cache[collection_name] = (stats, stats_json)
+        return stats_json
+
+    def _index_params(self):
+        """
+        Builds the index parameters for a collection's embedding field.
+        """
+        # SQ8 stores one byte per dimension in the index instead of four
+        index_params = self.milvus_client.prepare_index_params()
+        index_params.add_index(
+            field_name="embedding", 
+            index_type="IVF_SQ8",
+            metric_type="COSINE",
+            params={"nlist": 128}
+        )
+        return index_params
+
     def add_collection(self, collection_name: str, description: str="A searchable file collection.", callback=None) -> bool:
         """
         Adds a collection to the vector store, and its metadata to the metadata file.
@@ -80,17 +398,16 @@ class VectorStore:
         Returns
             bool: A boolean indicating whether the operation succeeded.
         """
-        if not collection_name in self.milvus_client.list_collections():
+        if collection_name not in self._collections:
             schema = CollectionSchema(self.fields, description=description, auto_id=True)
-            self.milvus_client.create_collection(collection_name=collection_name, schema=schema)
-
-            # Add indexes
-            index_params = self.milvus_client.prepare_index_params()
-            index_params.add_index(
-                field_name="embedding", 
-                index_type="AUTOINDEX",
-                metric_type="COSINE"
-            )
+
+            with self._milvus_lock:
+                self.milvus_client.create_collection(
+                    collection_name=collection_name,
+                    schema=schema,
+                    index_params=self._index_params()
+                )
+            self._collections.add(collection_name)
 
             # Update vector store metadata
             collection_metadata = { 
@@ -98,7 +415,10 @@ class VectorStore:
                 "files": []
             }
             self.metadata["collections"].append(collection_metadata)
+            # Collection changes are written straight away to stay in step with Milvus
             self.update_metadata()
+            self.flush_metadata()
+            self.invalidate_collections()
 
             if callback:
                 callback()
@@ -113,15 +433,20 @@ class VectorStore:
         Returns
             bool: A boolean indicating whether the operation succeeded.
         """
-        if collection_name in self.milvus_client.list_collections():
-            response = self.milvus_client.drop_collection(collection_name=collection_name)
+        if collection_name in self._collections:
+            with self._milvus_lock:
+                response = self.milvus_client.drop_collection(collection_name=collection_name)
+            self._collections.discard(collection_name)
 
             # Update vector store metadata
             self.metadata["collections"] = [
                 c for c in self.metadata["collections"] 
                 if c["collection_name"] != collection_name
             ]
+            # Collection changes are written straight away to stay in step with Milvus
             self.update_metadata()
+            self.flush_metadata()
+            self.invalidate_collections()
 
             if callback:
                 callback()
@@ -129,19 +454,160 @@ class VectorStore:
         else:
             return False
 
-    def add_files_to_collection(self, collection, files) -> bool:
+    async def add_files_to_collection(self, collection, files) -> bool:
         """
         Adds files to a collection, and updates the collections metadata accordingly.
 
+        Files whose content is already in the collection are skipped. Each file is recorded in
+        the metadata once all of its chunks are inserted, and if ingest fails, the rows of files
+        that had not finished are deleted again, so retrying never duplicates them.
+
         Returns
             bool: A boolean indicating whether the operation succeeded.
         """
-        for file in files:
-            content = self.get_file_content(file)
-            chunks = self.split_text(content)
-            vectors = self.embed_chunks(chunks)
-            # Handle metadata here
-            self.add_to_collection(collection, vectors)
+        collection_metadata = next(
+            (c for c in self.metadata["collections"] if c["collection_name"] == collection), None
+        )
+        if collection_metadata is None:
+            return False
+
+        # Embeddings requests are network bound, so run several at once
+        semaphore = asyncio.Semaphore(VectorStore.EMBED_CONCURRENCY)
+        insert_lock = asyncio.Lock()
+        pending = []
+        tasks = []
+
+        # Records of the files this call ingests, each collecting the ids of its inserted rows
+        records = []
+
+        def record_file(record):
+            collection_metadata["files"].append(record)
+            self.update_metadata()
+
+        def on_inserted(rows, ids):
+            for (record, _), row_id in zip(rows, ids):
+                record["ids"].append(row_id)
+                if len(record["ids"]) == record["chunks"]:
+                    record_file(record)
+
+        def submit(batch):
+            tasks.append(asyncio.create_task(
+                self._embed_and_insert(collection, batch, semaphore, insert_lock, pending, on_inserted)
+            ))
+
+        # Files whose content is already in the collection are skipped, found by content hash
+        seen_hashes = {f["hash"] for f in collection_metadata["files"] if "hash" in f}
+
+        # Chunks are pooled across files, and each full batch starts embedding straight away,
+        # overlapping with the files that are still being fetched, parsed and split
+        buffer = []
+
+        async def split(file, content):
+            content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+            # Claimed before splitting so identical files in this call are only ingested once.
+            # Nothing is recorded until the chunks are inserted, so a failure leaves no trace
+            if content_hash in seen_hashes:
+                return
+            seen_hashes.add(content_hash)
+
+            chunks = await self.split_text_async(content)
+            record = {
+                "name": file["name"],
+                "path": file["path"],
+                "hash": content_hash,
+                "chunks": len(chunks),
+                "ids": []
+            }
+            records.append(record)
+            if not chunks:
+                record_file(record)
+                return
+
+            buffer.extend((record, chunk) for chunk in chunks)
+            while len(buffer) >= VectorStore.EMBED_BATCH_SIZE:
+                submit(buffer[:VectorStore.EMBED_BATCH_SIZE])
+                del buffer[:VectorStore.EMBED_BATCH_SIZE]
+
+        split_tasks = []
+        completed = False
+        try:
+            # Closed explicitly, so the file loads are cancelled as soon as anything fails
+            async with aclosing(self.file_handler.iter_file_contents(files)) as contents:
+                async for file, content in contents:
+                    split_tasks.append(asyncio.create_task(split(file, content)))
+            await asyncio.gather(*split_tasks)
+            if buffer:
+                submit(buffer)
+
+            await asyncio.gather(*tasks)
+            if pending:
+                await self._insert_rows(collection, pending, on_inserted)
+            completed = True
+        finally:
+            # If anything failed, the tasks still running are cancelled and awaited, so none
+            # outlives the call or has its exception go unretrieved. Splits go first, since
+            # they are what submits embedding batches
+            for task_list in (split_tasks, tasks):
+                for task in task_list:
+                    task.cancel()
+                await asyncio.gather(*task_list, return_exceptions=True)
+
+            if not completed:
+                await self._remove_partial_files(collection, records)
+            await self.flush_metadata_async()
+        return True
+
+    async def _embed_and_insert(self, collection, batch, semaphore, insert_lock, pending, on_inserted) -> None:
+        """
+        Embeds a batch of (record, chunk) pairs into pending, inserting them with a single call
+        once enough have accumulated.
+        """
+        async with semaphore:
+            vectors = await self.embed_chunks([chunk for _, chunk in batch])
+        # Inserts are serialised so batches are written in turn rather than parking several
+        # worker threads on the Milvus lock
+        async with insert_lock:
+            pending.extend(zip((record for record, _ in batch), vectors))
+            if len(pending) >= VectorStore.INSERT_BATCH_SIZE:
+                rows = pending[:]
+                pending.clear()
+                await self._insert_rows(collection, rows, on_inserted)
+
+    async def _insert_rows(self, collection, rows, on_inserted) -> None:
+        """
+        Inserts (record, row) pairs with a single call, passing the rows and their ids to
+        on_inserted. An insert on a worker thread can't be interrupted, so if this is cancelled
+        it still waits for the insert to end, and a rollback never misses rows it wrote.
+        """
+        insert = asyncio.ensure_future(
+            asyncio.to_thread(self.add_to_collection, collection, [row for _, row in rows])
+        )
+        try:
+            await asyncio.shield(insert)
+        finally:
+            if not insert.done():
+                await asyncio.wait([insert])
+            if not insert.cancelled() and insert.exception() is None:
+                on_inserted(rows, insert.result())
+
+    async def _remove_partial_files(self, collection, records) -> None:
+        """
+        Deletes the rows inserted for files whose ingest did not finish.
+        """
+        ids = [
+            row_id for record in records if len(record["ids"]) < record["chunks"]
+            for row_id in record["ids"]
+        ]
+        if not ids:
+            return
+        try:
+            await asyncio.to_thread(
+                self._call_milvus, lambda client: client.delete(collection_name=collection, ids=ids)
+            )
+            self._stats_cache.pop(collection, None)
+        except Exception as e:
+            # The ingest's own error is the one raised; this only leaves rows behind
+            self.app.log(f"Unable to remove partly ingested rows from '{collection}': {e}")
 
     def remove_files_from_collection(self, collection: str, files: List[Dict]) -> bool:
         """
@@ -152,9 +618,6 @@ class VectorStore:
         """
         pass
 
-    def get_file_content(self, file) -> str:
-        return self.file_handler.get_file_content(file)
-
     async def chunk_file(self, file_contents: str) -> List[str]:
         """
         """
@@ -176,31 +639,22 @@ class VectorStore:
         return response.choices[0].message.content
     
     def split_text(self, text, chunk_size=500, overlap=0) -> List[str]:
-        text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=chunk_size,
-            chunk_overlap=overlap,
-            length_function=len,
-            is_separator_regex=False,
-            separators=[
-                ".\n\n",
-                "\n\n",
-                ".\n",
-                "\n",
-                ".",
-                ",",
-                " ",
-                "\u200b",  # Zero-width space
-                "\uff0c",  # Fullwidth comma
-                "\u3001",  # Ideographic comma
-                "\uff0e",  # Fullwidth full stop
-                "\u3002",  # Ideographic full stop
-                "",
-            ],
-        )
-
-        return text_splitter.split_text(text)
+        return split_text(text, chunk_size, overlap)
 
-    def embed_chunks(self, chunks):
+    async def split_text_async(self, text, chunk_size=500, overlap=0) -> List[str]:
+        """
+        Splits text into chunks without blocking the event loop, using the worker
+        process pool for large texts so several files can be split on separate cores,
+        or a thread when there are no worker processes.
+        """
+        if len(text) < VectorStore.CHUNK_IN_PROCESS_MIN_SIZE:
+            return split_text(text, chunk_size, overlap)
+        if self.process_pool is None:
+            return await asyncio.to_thread(split_text, text, chunk_size, overlap)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.process_pool, split_text, text, chunk_size, overlap)
+
+    async def embed_chunks(self, chunks):
         """
         Embeds a list of chunks and returns a dictionary associating each
         text with its embedding.
@@ -211,26 +665,104 @@ class VectorStore:
                 "embedding": List[float]: The chunk embedding.
             }
         """
-        response = self.openai_client.embeddings.create(
-            input=chunks,
-            model="text-embedding-3-small",
-            dimensions=1024
-        )
-
-        chunk_documents = []
-        for i, chunk_response in enumerate(response.data):
-            embedding = chunk_response.embedding
-            chunk_document = { 
-                "text": chunks[i],
-                "embedding": embedding 
-            }
-            chunk_documents.append(chunk_document)
+        # Only chunks missing from the cache are sent, each distinct text once
+        keys = [self.embedding_cache.key(chunk) for chunk in chunks]
+        embeddings = await asyncio.to_thread(self.embedding_cache.get_many, set(keys))
+
+        # Texts another batch is already embedding are awaited rather than sent again
+        missing = {}
+        in_flight = {}
+        for key, chunk in zip(keys, chunks):
+            if key in embeddings or key in missing:
+                continue
+            if key in self._embeddings_in_flight:
+                in_flight[key] = self._embeddings_in_flight[key]
+            else:
+                missing[key] = chunk
+
+        if missing:
+            loop = asyncio.get_running_loop()
+            futures = {key: loop.create_future() for key in missing}
+            self._embeddings_in_flight.update(futures)
+            try:
+                response = await self._create_embeddings(list(missing.values()))
+                new_embeddings = [
+                    (key, chunk_response.embedding)
+                    for key, chunk_response in zip(missing, response.data)
+                ]
+                for key, embedding in new_embeddings:
+                    futures[key].set_result(embedding)
+            except Exception as e:
+                for future in futures.values():
+                    future.set_exception(e)
+                    # Retrieve it here so unawaited futures are not reported as never retrieved
+                    future.exception()
+                raise
+            finally:
+                for key, future in futures.items():
+                    self._embeddings_in_flight.pop(key, None)
+                    if not future.done():
+                        future.cancel()
+
+            embeddings.update(new_embeddings)
+            await asyncio.to_thread(self.embedding_cache.put_many, new_embeddings)
+
+        if in_flight:
+            # Shielded so cancelling this batch does not cancel the futures other batches share
+            results = await asyncio.gather(*map(asyncio.shield, in_flight.values()))
+            embeddings.update(zip(in_flight, results))
+
+        # MilvusClient.insert takes rows, so pair each chunk with its vector in a single pass
+        return [
+            {"text": chunk, "embedding": embeddings[key]}
+            for chunk, key in zip(chunks, keys)
+        ]
 
-        return chunk_documents
+    async def _create_embeddings(self, inputs: List[str]):
+        """
+        Requests embeddings for a batch of texts, backing off and retrying on transient errors.
+        """
+        for attempt in range(VectorStore.EMBED_MAX_RETRIES):
+            try:
+                return await self._embeddings_client.embeddings.create(
+                    input=inputs,
+                    model=VectorStore.EMBEDDING_MODEL,
+                    dimensions=VectorStore.EMBEDDING_DIM
+                )
+            except _RETRYABLE_EMBED_ERRORS as e:
+                if attempt == VectorStore.EMBED_MAX_RETRIES - 1:
+                    raise
+                await asyncio.sleep(_retry_delay(
+                    attempt, VectorStore.EMBED_RETRY_BASE_DELAY, VectorStore.EMBED_RETRY_MAX_DELAY, e
+                ))
+
+    def add_to_collection(self, collection, data) -> List[int]:
+        """
+        Inserts rows into a collection.
 
-    def add_to_collection(self, collection, data):
-        # Insert into Milvus collection
-        response = self.milvus_client.insert(collection_name=collection, data=data)
+        Returns
+            List[int]: The ids of the inserted rows, in the order of `data`.
+        """
+        # Insert into Milvus collection, reconnecting and retrying if the connection hiccups.
+        # This runs on a worker thread, so backing off with time.sleep doesn't block the event loop
+        client = self.milvus_client
+        for attempt in range(VectorStore.INSERT_MAX_RETRIES):
+            try:
+                if attempt:
+                    # Reconnecting is part of the attempt, so a server that is still down is
+                    # retried with backoff like any other failure
+                    self._reconnect(client)
+                with self._milvus_lock:
+                    client = self.milvus_client
+                    response = client.insert(collection_name=collection, data=data)
+                break
+            except MilvusException:
+                if attempt == VectorStore.INSERT_MAX_RETRIES - 1:
+                    raise
+                time.sleep(_retry_delay(
+                    attempt, VectorStore.INSERT_RETRY_BASE_DELAY, VectorStore.INSERT_RETRY_MAX_DELAY
+                ))
+        self._stats_cache.pop(collection, None)
         response_dict = dict(response)
         # Check all entities added ?
         # if response_dict["insert_count"] != len(data):
@@ -241,5 +773,5 @@ class VectorStore:
         #     response = self.milvus_client.insert(collection_name=collection, data=data)
         # except Exception as e:
         #     self.app.push_screen(DebugScreen(e))
-        
-        return
+
+        return list(response_dict["ids"])
@@ -0,0 +1,69 @@
+from types import SimpleNamespace
+
+import pytest
+
+from versed.vector_store import VectorStore
+
+
+class FakeEmbeddings:
+    """
+    Stands in for the OpenAI embeddings endpoint, recording every request it gets.
+    """
+
+    def __init__(self):
+        self.requests = []
+        # Requests containing this text fail, to exercise error handling
+        self.fail_on = None
+
+    async def create(self, input, model, dimensions):
+        self.requests.append(list(input))
+        if self.fail_on and any(self.fail_on in text for text in input):
+            raise RuntimeError("embedding failed")
+        return SimpleNamespace(data=[
+            SimpleNamespace(embedding=[1.0] + [0.0] * (dimensions - 1)) for _ in input
+        ])
+
+
+class FakeOpenAI:
+
+    def __init__(self):
+        self.embeddings = FakeEmbeddings()
+
+    def with_options(self, **options):
+        return self
+
+
+@pytest.fixture
+def make_store(tmp_path):
+    """
+    Opens VectorStores over the same data directory, closing them all at teardown.
+    """
+    stores = []
+
+    def make_store() -> VectorStore:
+        store = VectorStore(
+            app=SimpleNamespace(log=lambda *args: None),
+            data_dir=tmp_path,
+            default_collection_name="Default",
+            google_credentials=None,
+        )
+        store.initialise_openai_client(FakeOpenAI())
+        stores.append(store)
+        return store
+
+    yield make_store
+    for store in stores:
+        store.close_client()
+
+
+@pytest.fixture
+def store(make_store):
+    return make_store()
+
+
+@pytest.fixture
+def embedding_store():
+    # _create_embeddings only needs the embeddings client, so no Milvus is started
+    store = VectorStore.__new__(VectorStore)
+    store.initialise_openai_client(FakeOpenAI())
+    return store
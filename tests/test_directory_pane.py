@@ -0,0 +1,58 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+from textual.app import App
+
+from versed.file_handler import FileHandler
+from versed.gdrive_file_handler import GoogleDriveHandler
+from versed.panes.directory_pane import GoogleDriveTree
+
+
+FOLDER = "application/vnd.google-apps.folder"
+
+
+class TreeApp(App):
+
+    def __init__(self):
+        super().__init__()
+        self.credentials = None
+        self.vector_store = SimpleNamespace(file_handler=FileHandler(None))
+        self.mimetype_extensions = {FOLDER: ""}
+
+    def compose(self):
+        yield GoogleDriveTree("Google Drive")
+
+
+def test_folder_listings_are_bounded(monkeypatch):
+    monkeypatch.setattr(GoogleDriveHandler, "MAX_CONCURRENCY", 2)
+    lock = threading.Lock()
+    listings = {"in_flight": 0, "most": 0}
+
+    def list_folder_page(self, folder_id="root", page_token=None):
+        if folder_id == "root":
+            return [{"id": f"d{i}", "name": f"dir{i}", "mimeType": FOLDER} for i in range(5)], None
+        with lock:
+            listings["in_flight"] += 1
+            listings["most"] = max(listings["most"], listings["in_flight"])
+        time.sleep(0.1)
+        with lock:
+            listings["in_flight"] -= 1
+        return [], None
+
+    monkeypatch.setattr(GoogleDriveHandler, "list_folder_page", list_folder_page)
+
+    async def expand_all():
+        app = TreeApp()
+        async with app.run_test() as pilot:
+            tree = app.query_one(GoogleDriveTree)
+            await app.workers.wait_for_complete()
+            for node in tree.root.children:
+                node.expand()
+            await pilot.pause()
+            await app.workers.wait_for_complete()
+            return [node.data["loaded"] for node in tree.root.children]
+
+    assert asyncio.run(expand_all()) == [True] * 5
+    assert listings["most"] == 2
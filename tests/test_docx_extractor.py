@@ -0,0 +1,68 @@
+import io
+
+import docx
+from docx.enum.text import WD_BREAK
+import pytest
+
+from versed.docx_extractor import (
+    _extract_docx_document,
+    _extract_docx_paragraphs,
+    extract_docx_text,
+)
+
+
+def docx_bytes(build) -> bytes:
+    document = docx.Document()
+    build(document)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def paragraphs(document):
+    document.add_paragraph("First paragraph.")
+    document.add_paragraph("")
+    run = document.add_paragraph("Tab").add_run()
+    run.add_tab()
+    run.add_text("then a line break")
+    run.add_break()
+    run.add_text("and a page break")
+    run.add_break(WD_BREAK.PAGE)
+    document.add_paragraph("Ünïcödé and emoji 🙂")
+
+
+def with_table(document):
+    document.add_paragraph("Before the table.")
+    table = document.add_table(rows=2, cols=2)
+    table.cell(0, 0).text = "a"
+    table.cell(1, 1).text = "d"
+    document.add_paragraph("After the table.")
+
+
+def test_fast_path_matches_python_docx():
+    data = docx_bytes(paragraphs)
+    fast = _extract_docx_paragraphs(data)
+    assert fast is not None
+    assert fast == _extract_docx_document(data)
+
+
+def test_tables_fall_back_to_python_docx():
+    data = docx_bytes(with_table)
+    assert _extract_docx_paragraphs(data) is None
+
+    content = extract_docx_text(data)
+    assert content == _extract_docx_document(data)
+    assert "<Table>" in content and "<Cell>\nd\n</Cell>" in content
+
+
+def test_reads_paths_and_bytes_alike(tmp_path):
+    data = docx_bytes(paragraphs)
+    path = tmp_path / "document.docx"
+    path.write_bytes(data)
+    assert extract_docx_text(str(path)) == extract_docx_text(data)
+
+
+def test_invalid_archive_is_left_to_python_docx():
+    assert _extract_docx_paragraphs(b"not a zip file") is None
+    with pytest.raises(Exception):
+        extract_docx_text(b"not a zip file")
@@ -0,0 +1,81 @@
+import asyncio
+import os
+import tempfile
+import threading
+
+from versed.file_handler import FileHandler
+
+
+def spilled_download(started, release):
+    """
+    Stands in for a Drive download that spills to a temporary file once allowed to finish.
+    """
+    def download(file):
+        started.set()
+        release.wait(5)
+        spill = tempfile.NamedTemporaryFile(delete=False)
+        spill.write(b"downloaded")
+        spill.seek(0)
+        return {"stream": spill, "type": ".txt", "disk_path": spill.name, "temporary": True}
+
+    return download
+
+
+def test_cancelled_download_removes_its_temporary_file(monkeypatch):
+    handler = FileHandler(None)
+    started, release = threading.Event(), threading.Event()
+    downloads = []
+    download = spilled_download(started, release)
+
+    def tracked_download(file):
+        downloads.append(download(file))
+        return downloads[-1]
+
+    monkeypatch.setattr(handler.gdrive_file_handler, "_get_google_drive_file_stream", tracked_download)
+
+    async def cancel_mid_download():
+        load = asyncio.create_task(handler._load({"name": "a.txt", "path": "gdrive://file/a"}))
+        await asyncio.to_thread(started.wait, 5)
+        load.cancel()
+        # Let the download finish only after the load has been cancelled
+        asyncio.get_running_loop().call_later(0.05, release.set)
+        try:
+            await load
+        except asyncio.CancelledError:
+            return True
+        return False
+
+    assert asyncio.run(cancel_mid_download())
+    (resolved,) = downloads
+    assert resolved["stream"].closed
+    assert not os.path.exists(resolved["disk_path"])
+
+
+def test_cancelled_parse_keeps_the_stream_open_until_read(tmp_path, monkeypatch):
+    handler = FileHandler(None)
+    path = tmp_path / "a.txt"
+    path.write_text("some text")
+    started, release = threading.Event(), threading.Event()
+    reads = []
+
+    def slow_content(resolved_file):
+        started.set()
+        release.wait(5)
+        reads.append(resolved_file["stream"].closed)
+        return resolved_file["stream"].read().decode("utf-8")
+
+    monkeypatch.setattr(handler, "_get_content", slow_content)
+
+    async def cancel_mid_parse():
+        load = asyncio.create_task(handler._load({"name": "a.txt", "path": str(path)}))
+        await asyncio.to_thread(started.wait, 5)
+        load.cancel()
+        asyncio.get_running_loop().call_later(0.05, release.set)
+        try:
+            await load
+        except asyncio.CancelledError:
+            return True
+        return False
+
+    assert asyncio.run(cancel_mid_parse())
+    assert reads == [False]
@@ -0,0 +1,38 @@
+import io
+import os
+
+from versed.gdrive_file_handler import _ChunkWriter
+
+
+def test_small_downloads_stay_in_memory():
+    writer = _ChunkWriter(max_size=10)
+    writer.write(b"hello")
+    writer.write(b"world")
+
+    stream = writer.to_stream()
+    assert isinstance(stream, io.BytesIO)
+    assert stream.read() == b"helloworld"
+
+
+def test_large_downloads_spill_to_a_named_file():
+    writer = _ChunkWriter(max_size=10)
+    for chunk in (b"hello", b"world", b"!", b"more"):
+        writer.write(chunk)
+
+    stream = writer.to_stream()
+    try:
+        assert isinstance(stream.name, str) and os.path.exists(stream.name)
+        assert stream.read() == b"helloworld!more"
+    finally:
+        stream.close()
+        os.remove(stream.name)
+
+
+def test_discard_removes_the_spilled_file():
+    writer = _ChunkWriter(max_size=4)
+    writer.write(b"too large")
+    path = writer.file.name
+
+    writer.discard()
+    assert not os.path.exists(path)
+    assert writer.chunks == []
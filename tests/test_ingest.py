@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+from versed.vector_store import VectorStore
+
+
+def row_count(store, collection="Default") -> int:
+    result = store.milvus_client.query(collection, filter="", output_fields=["count(*)"])
+    return result[0]["count(*)"]
+
+
+def write_files(directory, texts):
+    directory.mkdir(exist_ok=True)
+    files = []
+    for name, text in texts.items():
+        (directory / name).write_text(text)
+        files.append({"name": name, "path": str(directory / name)})
+    return files
+
+
+def recorded_files(store, collection="Default"):
+    metadata = next(c for c in store.metadata["collections"] if c["collection_name"] == collection)
+    return {record["name"]: record for record in metadata["files"]}
+
+
+def test_files_already_ingested_are_skipped(store, tmp_path):
+    files = write_files(tmp_path / "docs", {"a.txt": "alpha " * 300, "b.txt": "beta " * 300})
+
+    asyncio.run(store.add_files_to_collection("Default", files))
+    requests = len(store.openai_client.embeddings.requests)
+    rows = row_count(store)
+    assert requests > 0 and rows > 0
+
+    asyncio.run(store.add_files_to_collection("Default", files))
+    assert len(store.openai_client.embeddings.requests) == requests
+    assert row_count(store) == rows
+
+
+def test_identical_files_in_one_call_are_ingested_once(store, tmp_path):
+    files = write_files(tmp_path / "docs", {"a.txt": "same " * 300, "b.txt": "same " * 300})
+
+    asyncio.run(store.add_files_to_collection("Default", files))
+    records = recorded_files(store)
+    assert len(records) == 1
+    (record,) = records.values()
+    assert row_count(store) == record["chunks"] == len(record["ids"])
+
+
+def test_recorded_files_survive_a_restart(store, make_store, tmp_path):
+    files = write_files(tmp_path / "docs", {"a.txt": "alpha " * 300})
+    asyncio.run(store.add_files_to_collection("Default", files))
+    store.close_client()
+
+    reopened = make_store()
+    asyncio.run(reopened.add_files_to_collection("Default", files))
+    assert reopened.openai_client.embeddings.requests == []
+
+
+def test_failed_ingest_leaves_no_partial_files(store, tmp_path, monkeypatch):
+    # Small batches so some rows are inserted before the failing batch is reached
+    monkeypatch.setattr(VectorStore, "EMBED_BATCH_SIZE", 2)
+    monkeypatch.setattr(VectorStore, "INSERT_BATCH_SIZE", 2)
+    files = write_files(tmp_path / "docs", {
+        "a.txt": "alpha " * 400,
+        "b.txt": "beta " * 400,
+        "poison.txt": "poison " * 400,
+    })
+    store.openai_client.embeddings.fail_on = "poison"
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(store.add_files_to_collection("Default", files))
+    records = recorded_files(store)
+    assert "poison.txt" not in records
+    assert row_count(store) == sum(record["chunks"] for record in records.values())
+
+    store.openai_client.embeddings.fail_on = None
+    asyncio.run(store.add_files_to_collection("Default", files))
+    records = recorded_files(store)
+    assert set(records) == {"a.txt", "b.txt", "poison.txt"}
+    assert all(len(record["ids"]) == record["chunks"] for record in records.values())
+    assert row_count(store) == sum(record["chunks"] for record in records.values())
@@ -0,0 +1,135 @@
+import asyncio
+import threading
+
+import httpx
+from openai import APIConnectionError, BadRequestError, RateLimitError
+import pytest
+from pymilvus import MilvusException
+
+from versed import vector_store
+from versed.vector_store import VectorStore, _retry_delay
+
+
+def api_error(error_type, status, headers=None):
+    request = httpx.Request("POST", "https://api.openai.com/v1/embeddings")
+    response = httpx.Response(status, headers=headers, request=request)
+    return error_type("error", response=response, body=None)
+
+
+def test_retry_delay_is_capped_and_jittered():
+    for attempt in range(10):
+        assert 0 <= _retry_delay(attempt, 0.5, 4.0) <= 4.0
+
+
+def test_retry_delay_honours_retry_after():
+    error = api_error(RateLimitError, 429, {"retry-after": "7"})
+    assert _retry_delay(0, 0.5, 30.0, error) == 7.0
+    # But never beyond the cap
+    assert _retry_delay(0, 0.5, 5.0, error) == 5.0
+
+
+def test_retry_delay_ignores_an_unparseable_retry_after():
+    error = api_error(RateLimitError, 429, {"retry-after": "soon"})
+    assert _retry_delay(0, 0.5, 1.0, error) <= 1.0
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+
+    async def sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(vector_store.asyncio, "sleep", sleep)
+    return delays
+
+
+def test_transient_errors_are_retried(embedding_store, sleeps):
+    store = embedding_store
+    embeddings = store.openai_client.embeddings
+    create = embeddings.create
+    failures = [
+        api_error(RateLimitError, 429),
+        APIConnectionError(request=httpx.Request("POST", "https://api.openai.com/v1/embeddings")),
+    ]
+
+    async def flaky(**kwargs):
+        if failures:
+            raise failures.pop(0)
+        return await create(**kwargs)
+
+    embeddings.create = flaky
+    response = asyncio.run(store._create_embeddings(["text"]))
+    assert len(response.data) == 1
+    assert len(sleeps) == 2
+
+
+def test_retries_give_up_after_the_last_attempt(embedding_store, sleeps):
+    store = embedding_store
+    attempts = []
+
+    async def rate_limited(**kwargs):
+        attempts.append(kwargs)
+        raise api_error(RateLimitError, 429)
+
+    store.openai_client.embeddings.create = rate_limited
+    with pytest.raises(RateLimitError):
+        asyncio.run(store._create_embeddings(["text"]))
+    assert len(attempts) == VectorStore.EMBED_MAX_RETRIES
+    assert len(sleeps) == VectorStore.EMBED_MAX_RETRIES - 1
+
+
+def test_client_errors_are_not_retried(embedding_store, sleeps):
+    store = embedding_store
+
+    async def bad_request(**kwargs):
+        raise api_error(BadRequestError, 400)
+
+    store.openai_client.embeddings.create = bad_request
+    with pytest.raises(BadRequestError):
+        asyncio.run(store._create_embeddings(["text"]))
+    assert sleeps == []
+
+
+class FakeMilvusClient:
+
+    def __init__(self, fail_inserts=0):
+        self.fail_inserts = fail_inserts
+        self.closed = False
+
+    def insert(self, collection_name, data):
+        if self.closed or self.fail_inserts:
+            self.fail_inserts -= 1
+            raise MilvusException(message="server unavailable")
+        return {"insert_count": len(data), "ids": list(range(len(data)))}
+
+    def list_collections(self):
+        return ["Default"]
+
+    def close(self):
+        self.closed = True
+
+
+def test_inserts_retry_while_the_server_is_unreachable(monkeypatch):
+    store = VectorStore.__new__(VectorStore)
+    store.milvus_uri = "unreachable.db"
+    store.milvus_client = failed = FakeMilvusClient(fail_inserts=1)
+    store._milvus_lock = threading.RLock()
+    store._stats_cache, store._stats_json_cache = {}, {}
+    monkeypatch.setattr(vector_store.time, "sleep", lambda delay: None)
+
+    # The first reconnect finds the server still down; the second succeeds
+    connections = [MilvusException(message="connection refused"), FakeMilvusClient()]
+
+    def get_milvus_client(uri):
+        connection = connections.pop(0)
+        if isinstance(connection, Exception):
+            # A failed connection keeps the store on its old client rather than a closed one
+            assert store.milvus_client is failed
+            raise connection
+        return connection
+
+    monkeypatch.setattr(vector_store, "get_milvus_client", get_milvus_client)
+    assert store.add_to_collection("Default", [{"text": "a"}, {"text": "b"}]) == [0, 1]
+    assert connections == []
+    assert failed.closed and not store.milvus_client.closed
@@ -0,0 +1,48 @@
+import pytest
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+from versed import text_splitter
+from versed.text_splitter import SPLITTER_SEPARATORS, split_text
+
+
+def reference_split(text, chunk_size, overlap):
+    return RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=overlap,
+        length_function=len,
+        is_separator_regex=False,
+        separators=SPLITTER_SEPARATORS,
+    ).split_text(text)
+
+
+def test_short_text_skips_the_splitter(monkeypatch):
+    def fail(*args):
+        raise AssertionError("splitter should not be built for text that fits one chunk")
+
+    monkeypatch.setattr(text_splitter, "_make_splitter", fail)
+    assert split_text("  A short note.\n", 500, 0) == ["A short note."]
+
+
+def test_short_whitespace_text_has_no_chunks(monkeypatch):
+    monkeypatch.setattr(text_splitter, "_make_splitter", None)
+    assert split_text(" \n\t ", 500, 0) == []
+
+
+@pytest.mark.parametrize("text", [
+    "A short note.",
+    "First sentence. Second sentence.\n\nA new paragraph, with a comma.\n" * 40,
+    "word " * 1000,
+])
+def test_matches_the_recursive_splitter(text):
+    assert split_text(text, 100, 0) == reference_split(text, 100, 0)
+
+
+@pytest.mark.parametrize("chunk_size, overlap", [(100, 0), (100, 20), (37, 5)])
+def test_unbroken_runs_are_windowed_like_the_recursive_splitter(chunk_size, overlap):
+    text = "x" * 1013
+    assert split_text(text, chunk_size, overlap) == reference_split(text, chunk_size, overlap)
+
+
+def test_unbroken_run_inside_normal_text_matches_the_recursive_splitter():
+    text = "Some words here. " * 10 + "y" * 450 + " and some words after."
+    assert split_text(text, 100, 10) == reference_split(text, 100, 10)
@@ -0,0 +1,77 @@
+import asyncio
+
+import orjson
+
+from versed import vector_store
+from versed.vector_store import VectorStore
+
+
+def test_collection_names_follow_add_and_remove(store):
+    assert store.add_collection("Notes")
+    assert not store.add_collection("Notes")
+    assert store.get_collection_names() == ["Default", "Notes"]
+    assert store.has_collection("Notes")
+
+    assert store.remove_collection("Notes")
+    assert not store.remove_collection("Notes")
+    assert store.get_collection_names() == ["Default"]
+    assert not store.has_collection("Notes")
+    assert [c["collection_name"] for c in store.metadata["collections"]] == ["Default"]
+
+
+def test_metadata_is_reconciled_with_milvus_on_startup(store, make_store, tmp_path):
+    store.add_collection("Notes")
+    store.close_client()
+    # An entry for a collection Milvus doesn't hold, and none for one it does
+    metadata = {
+        "version": VectorStore.METADATA_VERSION,
+        "collections": [
+            {"collection_name": "Default", "files": []},
+            {"collection_name": "Gone", "files": []},
+        ],
+    }
+    (tmp_path / "metadata.json").write_bytes(orjson.dumps(metadata))
+
+    reopened = make_store()
+    assert reopened.get_collection_names() == ["Default", "Notes"]
+    assert not reopened.has_collection("Gone")
+    described = [c["collection_name"] for c in reopened.metadata["collections"]]
+    assert sorted(described) == ["Default", "Notes"]
+
+
+def test_index_migration_runs_once(store, make_store, tmp_path, monkeypatch):
+    store.close_client()
+    metadata = orjson.loads((tmp_path / "metadata.json").read_bytes())
+    del metadata["version"]
+    (tmp_path / "metadata.json").write_bytes(orjson.dumps(metadata))
+
+    calls = []
+    list_indexes = vector_store.MilvusClient.list_indexes
+
+    def counting_list_indexes(self, *args, **kwargs):
+        calls.append(kwargs)
+        return list_indexes(self, *args, **kwargs)
+
+    monkeypatch.setattr(vector_store.MilvusClient, "list_indexes", counting_list_indexes)
+    for _ in range(2):
+        make_store().close_client()
+        assert len(calls) == 1
+
+
+def test_large_texts_are_split_off_the_event_loop_without_a_pool(monkeypatch):
+    store = VectorStore.__new__(VectorStore)
+    store.process_pool = None
+    threads = []
+
+    async def to_thread(func, *args):
+        threads.append(func)
+        return func(*args)
+
+    monkeypatch.setattr(vector_store.asyncio, "to_thread", to_thread)
+    asyncio.run(store.split_text_async("short text"))
+    assert threads == []
+
+    text = "word " * (VectorStore.CHUNK_IN_PROCESS_MIN_SIZE // 5 + 1)
+    chunks = asyncio.run(store.split_text_async(text))
+    assert threads == [vector_store.split_text]
+    assert chunks == store.split_text(text)